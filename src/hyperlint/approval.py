@@ -1,17 +1,25 @@
-import json
+import atexit
+import functools
+import hashlib
+import os
+import queue
+import threading
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
 from loguru import logger
 from pydantic import BaseModel
-from rich.columns import Columns
-from rich.console import Console
-from rich.panel import Panel
-from rich.syntax import Syntax
-from rich.text import Text
 
 from .config import SimpleConfig
+from .jsonio import loads
+
+if TYPE_CHECKING:
+    from pygments.lexer import Lexer
+    from rich.console import Console
+    from rich.syntax import SyntaxTheme
+    from rich.text import Text
 
 
 class ApprovalRequest(BaseModel):
@@ -26,13 +34,273 @@ class EditorApprovalRequest(BaseModel):
     existing_content: str | None
     replacement_content: str | None
 
-    model_config = {"json_encoders": {Path: str}}
-
 
 class EditorApproval(ApprovalRequest, EditorApprovalRequest):
     pass
 
 
+class ApprovalLogEntry(BaseModel):
+    """A single line of an approval log."""
+
+    decision_type: str
+    approved: bool
+    date: datetime
+    file_path: str
+    context: Dict[str, Any]
+
+
+# Upper bound on buffers per writev call (POSIX guarantees at least 16,
+# Linux and macOS allow 1024)
+_IOV_MAX = 1024
+
+
+def _append_chunks(fd: int, chunks: List[bytes]) -> None:
+    """Write chunks to a file descriptor, using one writev call where possible."""
+    if not hasattr(os, "writev"):
+        _write_all(fd, b"".join(chunks))
+        return
+    for start in range(0, len(chunks), _IOV_MAX):
+        batch = chunks[start : start + _IOV_MAX]
+        written = os.writev(fd, batch)
+        if written < sum(map(len, batch)):
+            # Short write: finish the remainder with plain writes
+            _write_all(fd, b"".join(batch)[written:])
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+class _ApprovalWriter:
+    """
+    Appends approval log chunks to disk on a background thread.
+
+    Keeps disk latency off the interactive prompt: callers enqueue a chunk and
+    return immediately. The thread drains whatever is queued, groups it by log
+    file and writes each file once. Files are opened for each write, so a log
+    or directory removed between writes is simply created again.
+    """
+
+    _queue: "queue.Queue[Optional[Tuple[Path, bytes]]]" = queue.Queue()
+    _thread: Optional[threading.Thread] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def submit(cls, log_file: Path, chunk: bytes) -> None:
+        if cls._thread is None:
+            with cls._lock:
+                if cls._thread is None:
+                    cls._thread = threading.Thread(
+                        target=cls._run, name="approval-log-writer", daemon=True
+                    )
+                    cls._thread.start()
+        cls._queue.put((log_file, chunk))
+
+    @classmethod
+    def wait(cls) -> None:
+        """Block until every submitted chunk has been written."""
+        if cls._thread is not None:
+            cls._queue.join()
+
+    @classmethod
+    def stop(cls) -> None:
+        """Write everything still queued and stop the writer thread."""
+        thread = cls._thread
+        if thread is None:
+            return
+        cls._queue.put(None)
+        thread.join()
+        cls._thread = None
+
+    @classmethod
+    def _run(cls) -> None:
+        while True:
+            batch = [cls._queue.get()]
+            while True:
+                try:
+                    batch.append(cls._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            chunks: Dict[Path, List[bytes]] = {}
+            for item in batch:
+                if item is not None:
+                    chunks.setdefault(item[0], []).append(item[1])
+            for log_file, file_chunks in chunks.items():
+                cls._write(log_file, file_chunks)
+
+            for _ in batch:
+                cls._queue.task_done()
+            if None in batch:
+                return
+
+    @classmethod
+    def _write(cls, log_file: Path, chunks: List[bytes]) -> None:
+        try:
+            # Chunks are already batched, so write to a raw append-only fd
+            flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+            try:
+                fd = os.open(log_file, flags, 0o644)
+            except FileNotFoundError:
+                # The log directory was removed since it was created
+                log_file.parent.mkdir(parents=True, exist_ok=True)
+                fd = os.open(log_file, flags, 0o644)
+            try:
+                _append_chunks(fd, chunks)
+            finally:
+                os.close(fd)
+        except Exception as e:
+            # Keep the thread alive so callers waiting on the queue never hang
+            logger.warning(f"Could not write approval log {log_file}: {e}")
+
+
+class _LogBuffer:
+    """
+    Pending JSONL lines for a single approval log file.
+
+    Approval logs are created per decision, so buffers are shared at module
+    level and keyed by log file path. Lines are handed to the writer thread as
+    one chunk once a batch fills up, when flushed explicitly, or at exit.
+    Editors fix files on several threads, so each buffer has its own lock.
+    """
+
+    _buffers: Dict[Path, "_LogBuffer"] = {}
+
+    def __init__(self, log_file: Path):
+        self.log_file = log_file
+        self.lines: List[bytes] = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_file(cls, log_file: Path) -> "_LogBuffer":
+        buffer = cls._buffers.get(log_file)
+        if buffer is None:
+            # setdefault keeps a single buffer if two threads race here
+            buffer = cls._buffers.setdefault(log_file, cls(log_file))
+        return buffer
+
+    def append(self, line: bytes, batch_size: int) -> None:
+        with self._lock:
+            self.lines.append(line)
+            if len(self.lines) >= batch_size:
+                self._submit()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._submit()
+
+    def _submit(self) -> None:
+        # Called with the lock held, so chunks are queued in append order
+        if self.lines:
+            lines, self.lines = self.lines, []
+            _ApprovalWriter.submit(self.log_file, b"".join(lines))
+
+    @classmethod
+    def flush_all(cls) -> None:
+        for buffer in cls._buffers.values():
+            buffer.flush()
+
+
+def flush_approval_logs() -> None:
+    """Write every buffered approval decision to disk."""
+    _LogBuffer.flush_all()
+    _ApprovalWriter.wait()
+
+
+@atexit.register
+def _close_approval_logs() -> None:
+    _LogBuffer.flush_all()
+    _ApprovalWriter.stop()
+
+
+# Replies accepted as "yes" at a prompt, and as "everything" at a batch prompt
+_YES = frozenset({"y", "yes"})
+_SELECT_ALL = _YES | {"a", "all"}
+
+
+@functools.cache
+def _prompt_labels() -> Dict[str, "Text"]:
+    """Styled prompt fragments, built once instead of parsing markup per prompt."""
+    from rich.text import Text
+
+    return {
+        "issue": Text("Issue:", style="bold"),
+        "original": Text("Original:", style="bold"),
+        "insertion": Text("Proposed insertion:", style="bold"),
+        "change_title": Text("Change Needed", style="bold green"),
+        "insertion_title": Text("Insertion Needed", style="bold blue"),
+    }
+
+
+# Hyperlint directories whose storage layout has already been created
+_ensured_storage_dirs: Set[Path] = set()
+
+# Previous decisions per log file, keyed by _approval_cache_key
+_decision_caches: Dict[Path, Dict[str, bool]] = {}
+
+
+def _approval_cache_key(kind: str, existing_content: str, proposed_fix: str) -> str:
+    raw = "\0".join((kind, existing_content, proposed_fix)).encode()
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _issue_cache_key(issue: Any, proposed_fix: Optional[str]) -> str:
+    if hasattr(issue, "insert_content"):
+        return _approval_cache_key("insert", "", proposed_fix or "")
+    return _approval_cache_key("edit", issue.existing_content, proposed_fix or "")
+
+
+def _get_decision_cache(log_file: Path) -> Dict[str, bool]:
+    """Return the decisions recorded in a log file, loading it on first use."""
+    cache = _decision_caches.get(log_file)
+    if cache is not None:
+        return cache
+
+    cache = _decision_caches[log_file] = {}
+    if not log_file.exists():
+        return cache
+
+    with open(log_file, "rb") as f:
+        for line in f:
+            try:
+                entry = loads(line)
+                context = entry["context"]
+                issue = context["issue"]
+                proposed_fix = context.get("proposed_fix") or ""
+                if "insert_content" in issue:
+                    key = _approval_cache_key("insert", "", proposed_fix)
+                else:
+                    key = _approval_cache_key(
+                        "edit", issue["existing_content"], proposed_fix
+                    )
+            except (ValueError, KeyError, TypeError):
+                continue
+            # Later lines win, so the cache holds the latest decision per edit
+            cache[key] = bool(entry["approved"])
+
+    logger.debug(f"Loaded {len(cache)} cached approval decisions from {log_file}")
+    return cache
+
+
+@functools.cache
+def _markdown_highlighting() -> Tuple["Lexer", "SyntaxTheme"]:
+    """Resolve the Pygments lexer and Rich theme for insertions once."""
+    from pygments.lexers import get_lexer_by_name
+    from rich.syntax import Syntax
+
+    return get_lexer_by_name("markdown"), Syntax.get_theme("monokai")
+
+
+@functools.cache
+def _get_console() -> "Console":
+    """Share one Console so terminal detection runs once per process."""
+    from rich.console import Console
+
+    return Console()
+
+
 class ApprovalLog(ABC):
     """
     Abstract base class for approval logging interfaces.
@@ -48,6 +316,18 @@ class ApprovalLog(ABC):
         """
         self.config = config
         self.decision_type = "editor"
+        self._log_file_path = self.get_log_file_path()
+
+    @property
+    def console(self) -> "Console":
+        return _get_console()
+
+    def _ensure_dirs_once(self) -> None:
+        """Create the storage directories the first time a log writes to them."""
+        hyperlint_dir = self.config.hyperlint_dir
+        if hyperlint_dir not in _ensured_storage_dirs:
+            self.config.ensure_storage_dirs()
+            _ensured_storage_dirs.add(hyperlint_dir)
 
     @abstractmethod
     def prompt_for_approval(self, context) -> bool:
@@ -72,31 +352,29 @@ class ApprovalLog(ABC):
             approved: Whether the action was approved
         """
         # Ensure hyperlint directory exists
-        self.config.ensure_storage_dirs()
-        
-        # Convert context to a JSON-serializable format
-        serializable_context = {}
-        for key, value in context.items():
-            if hasattr(value, 'model_dump'):  # Pydantic object
-                serializable_context[key] = value.model_dump()
-            else:
-                serializable_context[key] = value
-        
-        log_entry = {
-            "decision_type": decision_type,
-            "approved": approved,
-            "date": datetime.now().isoformat(),
-            "file_path": str(context.get("file_path", "")),
-            "context": serializable_context
-        }
-
-        # Get log file path and write to it
-        log_file = self.get_log_file_path()
-        with open(log_file, "a") as f:
-            f.write(json.dumps(log_entry) + "\n")
+        self._ensure_dirs_once()
+
+        # Pydantic serializes nested models, paths and the date in one pass
+        log_entry = ApprovalLogEntry(
+            decision_type=decision_type,
+            approved=approved,
+            date=datetime.now(),
+            file_path=str(context.get("file_path", "")),
+            context=context,
+        )
+        line = log_entry.__pydantic_serializer__.to_json(log_entry) + b"\n"
+
+        # Queue the line for a batched background write
+        log_file = self._log_file_path
+        _LogBuffer.for_file(log_file).append(line, self.config.log_flush_batch)
 
         logger.debug(f"Logged {decision_type} approval decision to {log_file}")
 
+    def flush(self) -> None:
+        """Write any buffered decisions for this log to disk."""
+        _LogBuffer.for_file(self._log_file_path).flush()
+        _ApprovalWriter.wait()
+
     @abstractmethod
     def get_log_file_path(self) -> Path:
         """
@@ -132,21 +410,76 @@ class ConsoleEditorApprovalLog(ApprovalLog):
         Returns:
             bool: True if approved, False otherwise
         """
+        cached = self._cached_decision(context)
+        if cached is not None:
+            return cached
+
+        self._show_change(context)
+        approved = self.console.input(
+            "\n[bold]Apply this change? [y/n]:[/bold] "
+        ).strip().lower() in _YES
+
+        self._record_decision(context, approved)
+        self._submit_decisions()
+        return approved
+
+    def _submit_decisions(self) -> None:
+        """
+        Hand reviewed decisions to the writer without waiting for a full
+        batch, so a crash loses at most what the writer has not reached yet.
+        """
+        _LogBuffer.for_file(self._log_file_path).flush()
+
+    def _cached_decision(self, context) -> Optional[bool]:
+        """Return the earlier decision for an identical edit, if caching is on."""
+        if not self.config.cache_approvals:
+            return None
+        issue = context.get('issue')
+        decision_cache = _get_decision_cache(self._log_file_path)
+        cached = decision_cache.get(_issue_cache_key(issue, context.get('proposed_fix')))
+        if cached is not None:
+            logger.debug(f"Reusing cached approval decision for line {issue.line}")
+        return cached
+
+    def _record_decision(self, context, approved: bool) -> None:
+        """Remember and log a decision the user just made."""
+        if self.config.cache_approvals:
+            decision_cache = _get_decision_cache(self._log_file_path)
+            key = _issue_cache_key(context.get('issue'), context.get('proposed_fix'))
+            decision_cache[key] = approved
+
+        # Log the decision
+        self.log_decision(self.decision_type, context, approved)
+
+    def _show_change(self, context, number: Optional[int] = None) -> None:
+        """Render a proposed edit, optionally numbered for batch selection."""
+        # Rich is only needed once a prompt is actually shown
+        from rich.columns import Columns
+        from rich.panel import Panel
+        from rich.syntax import Syntax
+        from rich.text import Text
+
         issue = context.get('issue')
         proposed_fix = context.get('proposed_fix')
         file_path = context.get('file_path')
 
         file_info = f"File: {file_path}" if file_path else ""
         line_info = f"Line: {issue.line}"
-        console = Console()
+        console = self.console
+        labels = _prompt_labels()
+        prefix = f"#{number} " if number is not None else ""
 
         if hasattr(issue, 'existing_content'):  # Replace or Delete issue
             issue_messages = "\n".join(issue.issue_message) if hasattr(issue, 'issue_message') else "Issue detected"
             console.print(
                 Panel.fit(
-                    f"{file_info}\n{line_info}\n\n[bold]Issue:[/bold]\n{issue_messages}\n\n"
-                    f"[bold]Original:[/bold]",
-                    title="[bold green]Change Needed[/bold green]",
+                    Text.assemble(
+                        f"{file_info}\n{line_info}\n\n",
+                        labels["issue"],
+                        f"\n{issue_messages}\n\n",
+                        labels["original"],
+                    ),
+                    title=Text.assemble(prefix, labels["change_title"]),
                     border_style="green",
                 )
             )
@@ -157,31 +490,20 @@ class ConsoleEditorApprovalLog(ApprovalLog):
             console.print(Columns([original_text, proposed_text]))
         elif hasattr(issue, 'insert_content'):  # Insert issue
             # Create syntax object for the insertion
-            insertion_syntax = Syntax(
-                proposed_fix or "", "markdown", theme="monokai"
-            )
+            lexer, theme = _markdown_highlighting()
+            insertion_syntax = Syntax(proposed_fix or "", lexer, theme=theme)
 
             console.print(
                 Panel.fit(
-                    f"{file_info}\n{line_info}\n\n[bold]Proposed insertion:[/bold]",
-                    title="[bold blue]Insertion Needed[/bold blue]",
+                    Text.assemble(f"{file_info}\n{line_info}\n\n", labels["insertion"]),
+                    title=Text.assemble(prefix, labels["insertion_title"]),
                     border_style="blue",
                 )
             )
             console.print(insertion_syntax)
 
-        approved = console.input(
-            "\n[bold]Apply this change? [y/n]:[/bold] "
-        ).lower().strip() in ("y", "yes")
-
-        # Log the decision
-        self.log_decision(self.decision_type, context, approved)
-
-        return approved
-
     def get_log_file_path(self) -> Path:
         """Get the path to the editor approval log file"""
-        self.config.ensure_storage_dirs()
         return self.config.get_judge_data_dir() / "editor_judge.jsonl"
 
 
@@ -192,6 +514,71 @@ class EditorApprovalLog(ConsoleEditorApprovalLog):
     pass
 
 
+def _parse_selection(reply: str, count: int) -> Set[int]:
+    """
+    Parse a batch selection such as "1-3,5" into the chosen 1-based numbers.
+
+    "a", "all", "y" and "yes" select everything; a blank reply selects nothing.
+    Numbers outside 1..count and unparseable parts are ignored.
+    """
+    reply = reply.strip().lower()
+    if reply in _SELECT_ALL:
+        return set(range(1, count + 1))
+
+    selected: Set[int] = set()
+    for part in reply.replace(" ", "").split(","):
+        start, _, end = part.partition("-")
+        try:
+            low = int(start)
+            high = int(end) if end else low
+        except ValueError:
+            continue
+        selected.update(range(max(low, 1), min(high, count) + 1))
+    return selected
+
+
+class BatchEditorApprovalLog(ConsoleEditorApprovalLog):
+    """
+    Console approval log for bulk runs.
+    Shows up to approval_batch_size numbered edits and reads a single
+    selection like "1-3,5" for all of them.
+    """
+
+    def prompt_for_approval(self, context) -> bool:
+        return self.prompt_for_approvals([context])[0]
+
+    def prompt_for_approvals(self, contexts: List[dict]) -> List[bool]:
+        """
+        Prompt the user to approve several proposed edits at once.
+
+        Args:
+            contexts: Approval contexts, as accepted by prompt_for_approval
+
+        Returns:
+            List[bool]: One decision per context, in the same order
+        """
+        decisions = [self._cached_decision(context) for context in contexts]
+        pending = [index for index, decision in enumerate(decisions) if decision is None]
+
+        batch_size = self.config.approval_batch_size
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start : start + batch_size]
+            for number, index in enumerate(batch, 1):
+                self._show_change(contexts[index], number)
+
+            reply = self.console.input(
+                f"\n[bold]Apply which changes? (1-{len(batch)}, e.g. 1-3,5; "
+                "a = all; blank = none):[/bold] "
+            )
+            selected = _parse_selection(reply, len(batch))
+            for number, index in enumerate(batch, 1):
+                decisions[index] = number in selected
+                self._record_decision(contexts[index], number in selected)
+            self._submit_decisions()
+
+        return [bool(decision) for decision in decisions]
+
+
 class SilentApprovalLog(ApprovalLog):
     """
     Silent approval log that always approves without user interaction.
@@ -212,14 +599,14 @@ class SilentApprovalLog(ApprovalLog):
         Returns:
             bool: Always True
         """
-        # Log the decision
-        self.log_decision(self.decision_type, context, True)
-        
+        # Nobody reviewed the change, so only log it when asked to
+        if self.config.log_silent_approvals:
+            self.log_decision(self.decision_type, context, True)
+
         return True
 
     def get_log_file_path(self) -> Path:
         """Get the path to the silent approval log file"""
-        self.config.ensure_storage_dirs()
         return self.config.get_judge_data_dir() / "silent_judge.jsonl"
 
 
@@ -249,18 +636,27 @@ class ImageApprovalLog(ApprovalLog):
 
     def get_log_file_path(self) -> Path:
         """Get the path to the image approval log file"""
-        self.config.ensure_storage_dirs()
         return self.config.get_judge_data_dir() / "image_judge.jsonl"
 
 
+_APPROVAL_LOG_TYPES: Dict[str, type] = {
+    "console": ConsoleEditorApprovalLog,
+    "batch": BatchEditorApprovalLog,
+    "image": ImageApprovalLog,
+    "silent": SilentApprovalLog,
+}
+
+
 def get_approval_log(config: SimpleConfig, approval_type: str | None = None) -> ApprovalLog:
     """
     Factory function to create the appropriate approval log instance.
     
     Args:
         config: SimpleConfig instance
-        approval_type: Type of approval log ("console", "image", "silent", None)
-                      If None, uses config.approval_type or defaults to "console"
+        approval_type: Type of approval log ("console", "batch", "image", "silent", None)
+                      If None, uses config.approval_type or defaults to "console".
+                      Editor types such as "editor" always prompt on the console,
+                      in batches only when config.approval_type is "batch"
                       
     Returns:
         ApprovalLog: The appropriate approval log instance
@@ -272,10 +668,10 @@ def get_approval_log(config: SimpleConfig, approval_type: str | None = None) ->
     # Determine approval type
     if approval_type is None:
         approval_type = getattr(config, 'approval_type', 'console')
-    
-    if approval_type == "silent":
-        return SilentApprovalLog(config)
-    elif approval_type == "image":
-        return ImageApprovalLog(config)
-    else:  # Default to console
-        return ConsoleEditorApprovalLog(config)
+    elif approval_type not in _APPROVAL_LOG_TYPES:
+        # Editor edits are never approved silently by configuration; the
+        # only configured type they follow is batch prompting
+        configured = getattr(config, 'approval_type', 'console')
+        approval_type = "batch" if configured == "batch" else "console"
+
+    return _APPROVAL_LOG_TYPES.get(approval_type, ConsoleEditorApprovalLog)(config)
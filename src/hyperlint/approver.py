@@ -1,30 +1,81 @@
-import json
+import hashlib
 import os
+import tempfile
 from pathlib import Path
 from random import shuffle
-from typing import List
+from typing import List, Optional
 
 import dspy  # type:ignore
 from loguru import logger
 
 from .approval import EditorApprovalLog
 from .config import DEFAULT_APPROVER_MODEL
+from .jsonio import dumps, loads
 
 # UNDER DEVELOPMENT, THIS DOESN'T WORK YET
 openapi_key = os.environ["OPENAI_API_KEY"]
 lm = dspy.LM(DEFAULT_APPROVER_MODEL, api_key=openapi_key)
 
 
-def load_change_data(file_path: Path):
-    dspy_examples: List[dspy.Example] = []
-    inputs = ["issue_type", "issue_message", "content_before", "content_after"]
-    with open(file_path, "r") as f:
-        for line in f.readlines():
-            as_json = json.loads(line)
+def _read_change_records(file_path: Path) -> List[dict]:
+    # Stream the log line by line, skipping blank lines
+    with open(file_path, "rb") as f:
+        return [loads(line) for line in f if line.strip()]
+
 
-            dspy_examples.append(dspy.Example(**as_json).with_inputs(*inputs))
+def _load_change_records(file_path: Path, cache_dir: Optional[Path]) -> List[dict]:
+    """
+    Parse the approval log, reusing a cached copy of the records while the
+    log's modification time and size are unchanged.
 
-    return dspy_examples
+    Each log has a single cache file, named after the log's path, that is
+    overwritten whenever the log changes. The cache is plain JSON, so a
+    tampered cache can at worst yield wrong records.
+    """
+    if cache_dir is None:
+        return _read_change_records(file_path)
+
+    stat = os.stat(file_path)
+    resolved = str(Path(file_path).resolve())
+    cache_path = cache_dir / f"{hashlib.sha256(resolved.encode()).hexdigest()}.json"
+    try:
+        cached = loads(cache_path.read_bytes())
+        if cached["mtime_ns"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+            return cached["records"]
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable approver cache {cache_path}: {e}")
+
+    records = _read_change_records(file_path)
+    cached = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "records": records}
+
+    # Write to a temporary file first so readers never see a partial cache
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=cache_dir, delete=False) as tmp:
+        tmp.write(dumps(cached))
+    os.replace(tmp.name, cache_path)
+
+    # Drop pickled caches written by earlier versions, one per log change
+    for stale in cache_dir.glob("*.pkl"):
+        stale.unlink(missing_ok=True)
+    return records
+
+
+def load_change_data(file_path: Path, cache_dir: Optional[Path] = None):
+    """
+    Load labelled approval decisions as dspy examples.
+
+    Args:
+        file_path: Approval log to read.
+        cache_dir: Directory for a parsed copy of the log, reused until the
+            log changes. The log is parsed on every call when not given.
+    """
+    inputs = ["issue_type", "issue_message", "content_before", "content_after"]
+    return [
+        dspy.Example(**record).with_inputs(*inputs)
+        for record in _load_change_records(file_path, cache_dir)
+    ]
 
 
 def split_train_test(data, train_percentage=0.5):
@@ -77,7 +128,9 @@ def train_module_small(data: List[dspy.Example]):
 
 
 def train_module(log: EditorApprovalLog):
-    labelled_data = load_change_data(log.get_log_file_path())
+    labelled_data = load_change_data(
+        log.get_log_file_path(), cache_dir=log.config.hyperlint_dir / "approver_cache"
+    )
     logger.info(f"Found {len(labelled_data)} examples")
     if len(labelled_data) < 15:
         logger.error("Not enough examples to train a model")
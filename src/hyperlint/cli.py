@@ -1,31 +1,87 @@
+import functools
 import glob
+import os
+import re
+import shutil
+import stat
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 
 import typer
-from rich.console import Console
-from rich.progress import Progress
-
-from .config import (
-    DEFAULT_CONFIG_PATH,
-    create_default_config,
-    create_default_rules,
-    load_config,
-)
-from .editors.custom_rules import RulesEditor
-from .editors.vale import ValeEditor
 
-console = Console()
+from .globs import translate
 
+# Rich, pydantic and the editors are imported by the commands that use them,
+# so `--help` and the rule management commands start quickly
+if TYPE_CHECKING:
+    from rich.console import Console
 
-def collect_files(
+    from .config import SimpleConfig
+    from .editors.core import BaseEditor
+
+_MARKDOWN_SUFFIXES = (".md", ".mdx")
+_GLOB_MAGIC_RE = re.compile(r"[*?[]")
+
+# Body of a new rule file; the placeholder is the rule name
+_RULE_TEMPLATE = b"""# Rule: %b
+
+Instructions for the rule go here. Describe the changes to make to the document.
+
+Example:
+- Find instances of passive voice and convert to active voice
+- Ensure bullet points are consistently formatted
+- Replace deprecated terminology with approved terms
+"""
+
+
+@functools.cache
+def _console() -> "Console":
+    from rich.console import Console
+
+    return Console()
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_patterns(patterns: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """
+    Combine glob patterns into one regex over POSIX paths, compiled once per
+    distinct set of patterns.
+
+    Like PurePath.match, "*" stays within one path segment and a relative
+    pattern matches the end of the path, so "*.md" matches any markdown file
+    and "drafts/*.md" any file directly inside a drafts directory.
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(translate(pattern) for pattern in patterns))
+
+
+def _as_posix(path: str) -> str:
+    return path if os.sep == "/" else path.replace(os.sep, "/")
+
+
+def iter_files(
     path: str,
     recursive: bool = False,
-    include_patterns: List[str] = None,
-    exclude_patterns: List[str] = None,
-) -> List[Path]:
+    include_patterns: Optional[List[str]] = None,
+    exclude_patterns: Optional[List[str]] = None,
+) -> Iterator[Path]:
     """
-    Collect markdown files from a path (file or directory).
+    Yield markdown files from a path (file or directory) as they are found.
+
+    Each file is yielded once, in no particular order.
 
     Args:
         path: File path, directory path, or glob pattern
@@ -33,61 +89,225 @@ def collect_files(
         include_patterns: List of glob patterns to include
         exclude_patterns: List of glob patterns to exclude
 
-    Returns:
-        List of Path objects for markdown files
+    Yields:
+        Path objects for markdown files
     """
-    path_obj = Path(path)
-    files = []
+    # One stat call tells files, directories and missing paths apart
+    try:
+        mode = os.stat(path).st_mode
+    except (OSError, ValueError):
+        mode = 0
 
     # If it's a file, return it directly
-    if path_obj.is_file():
+    if stat.S_ISREG(mode):
+        path_obj = Path(path)
         if path_obj.suffix in [".md", ".mdx"]:
-            return [path_obj]
+            yield path_obj
         else:
-            console.print(f"[yellow]Warning: {path} is not a markdown file[/yellow]")
-            return []
+            _console().print(
+                f"[yellow]Warning: {path} is not a markdown file[/yellow]"
+            )
+        return
 
     # If it's a directory, find markdown files
-    elif path_obj.is_dir():
-        if recursive:
-            files.extend(path_obj.rglob("*.md"))
-            files.extend(path_obj.rglob("*.mdx"))
-        else:
-            files.extend(path_obj.glob("*.md"))
-            files.extend(path_obj.glob("*.mdx"))
+    if stat.S_ISDIR(mode):
+        candidates = _iter_directory(path, recursive)
+
+    # A path without wildcards that is neither a file nor a directory
+    # does not exist, so there is nothing to expand
+    elif not _GLOB_MAGIC_RE.search(path):
+        return
 
     # If it's a glob pattern, expand it
     else:
-        expanded = glob.glob(path, recursive=recursive)
-        for p in expanded:
-            p_obj = Path(p)
-            if p_obj.is_file() and p_obj.suffix in [".md", ".mdx"]:
-                files.append(p_obj)
-
-    # Apply include patterns
-    if include_patterns:
-        filtered_files = []
-        for file in files:
-            for pattern in include_patterns:
-                if file.match(pattern):
-                    filtered_files.append(file)
-                    break
-        files = filtered_files
-
-    # Apply exclude patterns
-    if exclude_patterns:
-        filtered_files = []
-        for file in files:
-            excluded = False
-            for pattern in exclude_patterns:
-                if file.match(pattern):
-                    excluded = True
-                    break
-            if not excluded:
-                filtered_files.append(file)
-        files = filtered_files
-
-    return sorted(set(files))
+        candidates = (
+            os.path.normpath(p)
+            for p in glob.iglob(path, recursive=recursive)
+            if p.endswith(_MARKDOWN_SUFFIXES) and os.path.isfile(p)
+        )
+
+    # Candidates are plain strings, so duplicates are dropped cheaply and
+    # Path objects are built only for files that are yielded
+    include_re = _compile_patterns(tuple(include_patterns or ()))
+    exclude_re = _compile_patterns(tuple(exclude_patterns or ()))
+    seen: Set[str] = set()
+    for file in candidates:
+        if file in seen:
+            continue
+        seen.add(file)
+        if include_re and not include_re.match(_as_posix(file)):
+            continue
+        if exclude_re and exclude_re.match(_as_posix(file)):
+            continue
+        yield Path(file)
+
+
+def _iter_directory(path: str, recursive: bool) -> Iterator[str]:
+    # Walk the tree once, matching both suffixes on plain file names
+    if recursive:
+        for dirpath, _dirnames, filenames in os.walk(path):
+            for name in filenames:
+                if name.endswith(_MARKDOWN_SUFFIXES):
+                    yield os.path.join(dirpath, name)
+    else:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name.endswith(_MARKDOWN_SUFFIXES) and entry.is_file():
+                    yield entry.path
+
+
+def collect_files(
+    path: str,
+    recursive: bool = False,
+    include_patterns: Optional[List[str]] = None,
+    exclude_patterns: Optional[List[str]] = None,
+) -> List[Path]:
+    """
+    Collect markdown files from a path (file or directory).
+
+    Args:
+        path: File path, directory path, or glob pattern
+        recursive: Whether to search directories recursively
+        include_patterns: List of glob patterns to include
+        exclude_patterns: List of glob patterns to exclude
+
+    Returns:
+        Sorted list of Path objects for markdown files
+    """
+    return sorted(iter_files(path, recursive, include_patterns, exclude_patterns))
+
+
+def _split_csv(items: List[str]) -> List[str]:
+    """Flatten options that may each hold several comma-separated values."""
+    return [part.strip() for item in items for part in item.split(",") if part.strip()]
+
+
+class _PlainProgress:
+    """
+    Stand-in for rich's Progress when output is not a terminal, such as in
+    CI logs, where a live progress bar only adds rendering work.
+    """
+
+    def __init__(self, console: "Console"):
+        self.console = console
+        self.completed = 0
+
+    def __enter__(self) -> "_PlainProgress":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def add_task(self, description: str, total: Optional[int] = None) -> int:
+        return 0
+
+    def advance(self, task: int, advance: int = 1) -> None:
+        self.completed += advance
+
+
+def _make_progress():
+    """Return a rich progress bar on a terminal and a plain counter otherwise."""
+    console = _console()
+    if not console.is_terminal:
+        return _PlainProgress(console)
+
+    from rich.progress import Progress
+
+    return Progress(console=console, transient=True, refresh_per_second=4)
+
+
+def _process_one(
+    editor_cls: Type["BaseEditor"],
+    file_path: Path,
+    config: "SimpleConfig",
+    **editor_kwargs,
+) -> Optional[str]:
+    """
+    Run a single editor over one file, writing its changes, or in a dry run
+    returning them as a diff.
+    """
+    editor = editor_cls(path=file_path, config=config, **editor_kwargs)
+    if config.dry_run:
+        return editor.dry_run()
+    editor.update_file()
+    editor.get_approval_log().flush()
+    return None
+
+
+def _print_preview(console: "Console", preview: Optional[str]) -> None:
+    """Print a dry run's diff as plain text, without Rich markup or wrapping."""
+    if preview:
+        console.print(preview, markup=False, highlight=False, soft_wrap=True)
+
+
+def _process_files(
+    editor_cls: Type["BaseEditor"],
+    files: List[Path],
+    config: "SimpleConfig",
+    jobs: int = 1,
+    per_file_kwargs: Optional[Dict[Path, Dict[str, Any]]] = None,
+    **editor_kwargs,
+) -> Tuple[int, int]:
+    """
+    Run an editor over several files, showing progress as each one finishes.
+
+    Dry runs are processed on up to ``jobs`` threads. Writing a file always
+    ends with an "Update the file?" prompt, and prompts cannot share the
+    terminal, so other runs process files one at a time.
+
+    Returns:
+        The number of files that succeeded and the number that failed.
+    """
+    per_file_kwargs = per_file_kwargs or {}
+    if jobs > 1 and not config.dry_run:
+        _console().print(
+            "[yellow]--jobs only applies to dry runs; "
+            "processing files one at a time[/yellow]"
+        )
+        jobs = 1
+
+    success_count = 0
+    error_count = 0
+
+    with _make_progress() as progress:
+        task = progress.add_task("Processing files...", total=len(files))
+        with ThreadPoolExecutor(max_workers=min(jobs, len(files))) as executor:
+            futures = {
+                executor.submit(
+                    _process_one,
+                    editor_cls,
+                    file_path,
+                    config,
+                    **editor_kwargs,
+                    **per_file_kwargs.get(file_path, {}),
+                ): file_path
+                for file_path in files
+            }
+            for future in as_completed(futures):
+                file_path = futures[future]
+                try:
+                    preview = future.result()
+                    # Printed here, one file at a time, so diffs never interleave
+                    progress.console.print(f"Processed: {file_path}")
+                    _print_preview(progress.console, preview)
+                    success_count += 1
+                except Exception as e:
+                    _console().print(f"[red]Error processing {file_path}: {e}[/red]")
+                    error_count += 1
+                finally:
+                    progress.advance(task)
+
+    return success_count, error_count
+
+
+def __getattr__(name: str) -> Any:
+    # DEFAULT_CONFIG_PATH used to be imported here; defer to the config
+    # module, which resolves it and warns that it is deprecated
+    if name == "DEFAULT_CONFIG_PATH":
+        from . import config
+
+        return getattr(config, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 app = typer.Typer(
@@ -122,6 +342,9 @@ def vale(
     recursive: bool = False,
     include: List[str] = typer.Option([], help="Include files matching these patterns"),
     exclude: List[str] = typer.Option([], help="Exclude files matching these patterns"),
+    jobs: int = typer.Option(
+        1, min=1, help="Number of files to preview concurrently with --dry-run"
+    ),
 ):
     """
     Run Vale on markdown files to identify style issues.
@@ -148,6 +371,11 @@ def vale(
         # Include/exclude specific patterns
         hyperlint apply vale docs/ --recursive --exclude "draft_*.md" --include "*.md"
     """
+    from .config import load_config
+    from .editors.vale import ValeEditor
+
+    console = _console()
+
     # Collect files to process
     files = collect_files(path, recursive, include or None, exclude or None)
 
@@ -161,39 +389,29 @@ def vale(
     # Override config values with CLI parameters
     if dry_run:
         config.dry_run = True
+    config.approval_mode = require_approval
 
     # Process files
     if len(files) == 1:
         # Single file - use existing logic
-        editor = ValeEditor(path=files[0], config=config)
-        if config.dry_run:
-            editor.dry_run()
-        else:
-            editor.update_file()
+        _print_preview(console, _process_one(ValeEditor, files[0], config))
     else:
         # Multiple files - batch processing
         console.print(f"[blue]Processing {len(files)} files...[/blue]")
 
-        success_count = 0
-        error_count = 0
-
-        with Progress() as progress:
-            task = progress.add_task("Processing files...", total=len(files))
-
-            for file_path in files:
-                try:
-                    progress.console.print(f"Processing: {file_path}")
-                    editor = ValeEditor(path=file_path, config=config)
-                    if config.dry_run:
-                        editor.dry_run()
-                    else:
-                        editor.update_file()
-                    success_count += 1
-                except Exception as e:
-                    console.print(f"[red]Error processing {file_path}: {e}[/red]")
-                    error_count += 1
-                finally:
-                    progress.advance(task)
+        # Lint the files with as few Vale processes as possible up front;
+        # files missing from the result are linted again by their editor
+        vale_issues = ValeEditor.run_batch(files, config)
+
+        success_count, error_count = _process_files(
+            ValeEditor,
+            files,
+            config,
+            jobs,
+            per_file_kwargs={
+                fp: {"vale_issues": issues} for fp, issues in vale_issues.items()
+            },
+        )
 
         console.print(
             f"[green]Completed: {success_count} files processed successfully[/green]"
@@ -207,7 +425,9 @@ def apply_rules(
     path: str,
     include_rules: List[str] = [],
     exclude_rules: List[str] = [],
-    rules_directory: str = "rules",
+    rules_directory: Path = typer.Option(
+        Path("rules"), exists=True, file_okay=False, dir_okay=True
+    ),
     dry_run: bool = False,
     require_approval: bool = True,
     log_approvals: bool = True,
@@ -215,6 +435,9 @@ def apply_rules(
     recursive: bool = False,
     include: List[str] = typer.Option([], help="Include files matching these patterns"),
     exclude: List[str] = typer.Option([], help="Exclude files matching these patterns"),
+    jobs: int = typer.Option(
+        1, min=1, help="Number of files to preview concurrently with --dry-run"
+    ),
 ):
     """
     Apply AI-powered rules to markdown documents.
@@ -244,6 +467,11 @@ def apply_rules(
         # Include/exclude specific file patterns
         hyperlint apply rules docs/ rules/ --recursive --exclude "draft_*.md"
     """
+    from .config import load_config
+    from .editors.custom_rules import RulesEditor
+
+    console = _console()
+
     # Collect files to process
     files = collect_files(path, recursive, include or None, exclude or None)
 
@@ -261,78 +489,45 @@ def apply_rules(
         config.approval_mode = require_approval
 
     # Always set rules directory since it's now required
-    config.custom_rules.rules_directory = Path(rules_directory)
+    config.custom_rules.rules_directory = rules_directory
 
-    # Handle include_rules and exclude_rules list parsing
-    include_list = []
-    exclude_list = []
-
-    if include_rules:
-        if len(include_rules) == 1 and "," in include_rules[0]:
-            include_list = include_rules[0].split(",")
-        else:
-            include_list = include_rules
+    # Rule names may be repeated or given comma-separated
+    include_list = _split_csv(include_rules)
+    exclude_list = _split_csv(exclude_rules)
 
     if include_list:
         config.custom_rules.include_rules = include_list
 
-    if exclude_rules:
-        if len(exclude_rules) == 1 and "," in exclude_rules[0]:
-            exclude_list = exclude_rules[0].split(",")
-        else:
-            exclude_list = exclude_rules
-
     if exclude_list:
-        config.custom_rules.exclude_rules = exclude_rules
+        config.custom_rules.exclude_rules = exclude_list
 
     # Process files
     if len(files) == 1:
         # Single file - use existing logic
-        editor = RulesEditor(
-            path=files[0],
-            config=config,
-            rules_directory=Path(rules_directory),
+        preview = _process_one(
+            RulesEditor,
+            files[0],
+            config,
+            rules_directory=rules_directory,
             include_rules=include_list,
             exclude_rules=exclude_list,
             dry_run=dry_run,
         )
-
-        if config.dry_run:
-            editor.dry_run()
-        else:
-            editor.update_file()
+        _print_preview(console, preview)
     else:
         # Multiple files - batch processing
         console.print(f"[blue]Processing {len(files)} files with rules...[/blue]")
 
-        success_count = 0
-        error_count = 0
-
-        with Progress() as progress:
-            task = progress.add_task("Processing files...", total=len(files))
-
-            for file_path in files:
-                try:
-                    progress.console.print(f"Processing: {file_path}")
-                    editor = RulesEditor(
-                        path=file_path,
-                        config=config,
-                        rules_directory=Path(rules_directory),
-                        include_rules=include_list,
-                        exclude_rules=exclude_list,
-                        dry_run=dry_run,
-                    )
-
-                    if config.dry_run:
-                        editor.dry_run()
-                    else:
-                        editor.update_file()
-                    success_count += 1
-                except Exception as e:
-                    console.print(f"[red]Error processing {file_path}: {e}[/red]")
-                    error_count += 1
-                finally:
-                    progress.advance(task)
+        success_count, error_count = _process_files(
+            RulesEditor,
+            files,
+            config,
+            jobs,
+            rules_directory=rules_directory,
+            include_rules=include_list,
+            exclude_rules=exclude_list,
+            dry_run=dry_run,
+        )
 
         console.print(
             f"[green]Completed: {success_count} files processed successfully[/green]"
@@ -350,7 +545,11 @@ app.add_typer(rules_app, name="manage-rules")
 
 
 @rules_app.command(name="list")
-def list_rules(rules_directory: str):
+def list_rules(
+    rules_directory: Path = typer.Argument(
+        ..., exists=True, file_okay=False, dir_okay=True
+    ),
+):
     """
     List all available rules in the directory.
 
@@ -361,27 +560,29 @@ def list_rules(rules_directory: str):
         # List rules in a custom directory
         hyperlint rules list custom-rules/
     """
-    rules_dir_obj = Path(rules_directory)
-
-    if not rules_dir_obj.exists() or not rules_dir_obj.is_dir():
-        print(
-            f"Error: Rules directory does not exist or is not a directory: {rules_directory}"
+    with os.scandir(rules_directory) as entries:
+        rule_names = sorted(
+            entry.name[: -len(".md")]
+            for entry in entries
+            if entry.name.endswith(".md") and entry.is_file()
         )
-        raise typer.Exit(code=1)
 
-    rules = list(rules_dir_obj.glob("*.md"))
-
-    if not rules:
+    if not rule_names:
         print(f"No rules found in directory: {rules_directory}")
         return
 
-    print(f"Found {len(rules)} rules in directory: {rules_directory}\n")
-    for rule_path in sorted(rules):
-        print(f"- {rule_path.stem}")
+    print(f"Found {len(rule_names)} rules in directory: {rules_directory}\n")
+    for rule_name in rule_names:
+        print(f"- {rule_name}")
 
 
 @rules_app.command(name="view")
-def view_rule(rules_directory: str, rule_name: str):
+def view_rule(
+    rules_directory: Path = typer.Argument(
+        ..., exists=True, file_okay=False, dir_okay=True
+    ),
+    rule_name: str = typer.Argument(...),
+):
     """
     Display the content of a specific rule.
 
@@ -392,29 +593,32 @@ def view_rule(rules_directory: str, rule_name: str):
         # View a rule in a custom directory
         hyperlint rules view custom-rules/ bullet_consistency.md
     """
-    rules_dir_obj = Path(rules_directory)
-
     if not rule_name.endswith(".md"):
         rule_name = f"{rule_name}.md"
 
-    rule_path = rules_dir_obj / rule_name
+    rule_path = rules_directory / rule_name
 
     if not rule_path.exists():
         print(f"Error: Rule not found: {rule_name}")
         raise typer.Exit(code=1)
 
     try:
-        with open(rule_path, "r") as f:
-            rule_content = f.read()
-        print(f"--- Rule: {rule_path.stem} ---\n")
-        print(rule_content)
+        with open(rule_path, "rb") as f:
+            print(f"--- Rule: {rule_path.stem} ---\n", flush=True)
+            # Stream the rule straight to stdout without decoding it
+            shutil.copyfileobj(f, sys.stdout.buffer)
+            sys.stdout.buffer.write(b"\n")
+            sys.stdout.flush()
     except Exception as e:
         print(f"Error reading rule: {e}")
         raise typer.Exit(code=1)
 
 
 @rules_app.command(name="create")
-def create_rule(rules_directory: str, rule_name: str):
+def create_rule(
+    rules_directory: Path = typer.Argument(..., file_okay=False, dir_okay=True),
+    rule_name: str = typer.Argument(...),
+):
     """
     Create a new empty rule file with a template.
 
@@ -428,36 +632,33 @@ def create_rule(rules_directory: str, rule_name: str):
         # Create a rule in a custom directory (extension optional)
         hyperlint rules create custom-rules/ bullet_consistency.md
     """
-    rules_dir_obj = Path(rules_directory)
-
-    if not rules_dir_obj.exists():
+    if not rules_directory.exists():
         print(f"Creating rules directory: {rules_directory}")
-        rules_dir_obj.mkdir(parents=True)
+        rules_directory.mkdir(parents=True)
 
     if not rule_name.endswith(".md"):
         rule_name = f"{rule_name}.md"
 
-    rule_path = rules_dir_obj / rule_name
+    rule_path = rules_directory / rule_name
 
-    if rule_path.exists():
+    try:
+        # O_EXCL makes creation fail atomically if the rule already exists
+        fd = os.open(rule_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
         print(f"Error: Rule already exists: {rule_name}")
         raise typer.Exit(code=1)
+    except Exception as e:
+        print(f"Error creating rule: {e}")
+        raise typer.Exit(code=1)
 
     try:
-        with open(rule_path, "w") as f:
-            f.write(f"""# Rule: {rule_path.stem}
-
-Instructions for the rule go here. Describe the changes to make to the document.
-
-Example:
-- Find instances of passive voice and convert to active voice
-- Ensure bullet points are consistently formatted
-- Replace deprecated terminology with approved terms
-""")
+        os.write(fd, _RULE_TEMPLATE % rule_path.stem.encode())
         print(f"Created rule: {rule_path}")
     except Exception as e:
         print(f"Error creating rule: {e}")
         raise typer.Exit(code=1)
+    finally:
+        os.close(fd)
 
 
 # Add config subcommand for managing configurations
@@ -478,7 +679,15 @@ def init_project():
         # Initialize project in current directory
         hyperlint init
     """
-    config_path = Path(DEFAULT_CONFIG_PATH)
+    from .config import (
+        create_default_config,
+        create_default_rules,
+        default_config_path,
+    )
+
+    console = _console()
+
+    config_path = default_config_path()
     rules_dir = Path("rules")
 
     # Check if already initialized
@@ -500,8 +709,9 @@ def init_project():
         if not rules_dir.exists():
             create_default_rules(rules_dir)
             console.print(f"[green]Created rules directory: {rules_dir}[/green]")
+            rule_count = sum(1 for p in rules_dir.iterdir() if p.suffix == ".md")
             console.print(
-                f"[green]Added {len(list(rules_dir.glob('*.md')))} default grammar rules[/green]"
+                f"[green]Added {rule_count} default grammar rules[/green]"
             )
         else:
             console.print(f"[blue]Rules directory already exists: {rules_dir}[/blue]")
@@ -516,7 +726,9 @@ def init_project():
 
 @config_app.command(name="init")
 def init_config():
-    config_path = Path(DEFAULT_CONFIG_PATH)
+    from .config import create_default_config, default_config_path
+
+    config_path = default_config_path()
     if config_path.exists():
         print(f"Error: Configuration already exists: {config_path}")
         raise typer.Exit(code=1)
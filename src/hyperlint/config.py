@@ -1,14 +1,27 @@
+import os
+import warnings
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
-import yaml
 from loguru import logger
 from pydantic import BaseModel, DirectoryPath, Field, FilePath
 
-DEFAULT_CONFIG_PATH = Path.cwd() / "hyperlint-config.yaml"
-DEFAULT_INI_PATH = Path.cwd() / ".vale.ini"
-DEFAULT_CUSTOM_RULES_PATH = Path.cwd() / "rules"
-DEFAULT_HYPERLINT_STORAGE_DIR = Path.cwd() / ".hyperlint"
+# Default locations are file names in the current directory, resolved when
+# they are needed so they follow the directory hyperlint is run from
+DEFAULT_CONFIG_NAME = "hyperlint-config.yaml"
+DEFAULT_INI_NAME = ".vale.ini"
+DEFAULT_CUSTOM_RULES_NAME = "rules"
+DEFAULT_HYPERLINT_STORAGE_NAME = ".hyperlint"
+
+# Former path constants, fixed at import time; still importable through the
+# module __getattr__ below, which resolves them when they are accessed
+_DEPRECATED_PATH_NAMES = {
+    "DEFAULT_CONFIG_PATH": DEFAULT_CONFIG_NAME,
+    "DEFAULT_INI_PATH": DEFAULT_INI_NAME,
+    "DEFAULT_CUSTOM_RULES_PATH": DEFAULT_CUSTOM_RULES_NAME,
+    "DEFAULT_HYPERLINT_STORAGE_DIR": DEFAULT_HYPERLINT_STORAGE_NAME,
+}
 
 DEFAULT_EDIT_MODEL = "anthropic/claude-3-haiku-20240307"
 DEFAULT_APPROVER_MODEL = "openai/gpt-4.1-nano"
@@ -17,12 +30,41 @@ DEFAULT_RULE_VIOLATION_MODEL = "openai/gpt-4o-mini"
 DELETE_LINE_MESSAGE = ">>>>>>>>>>>>>>DELETE<<<<<<<<<<<<<<<"
 
 
+# Written by create_default_config. Kept in step with SimpleConfig's fields;
+# paths are relative so they resolve against the directory hyperlint runs in.
+_DEFAULT_CONFIG_YAML = """\
+# Hyperlint Configuration
+vale:
+  config_path: .vale.ini
+custom_rules:
+  rules_directory: rules
+  include_rules: []
+  exclude_rules: []
+dry_run: false
+approval_mode: true
+approval_type: console
+approval_batch_size: 10
+log_silent_approvals: true
+log_flush_batch: 64
+cache_approvals: false
+fix_workers: 8
+hyperlint_dir: .hyperlint
+enabled_editors:
+- vale
+- custom_rules
+"""
+
+
 class ValeConfig(BaseModel):
-    config_path: FilePath = Field(default=Path(DEFAULT_INI_PATH))
+    config_path: FilePath = Field(
+        default_factory=lambda: Path.cwd() / DEFAULT_INI_NAME
+    )
 
 
 class CustomRulesConfig(BaseModel):
-    rules_directory: DirectoryPath = Field(default=Path(DEFAULT_CUSTOM_RULES_PATH))
+    rules_directory: DirectoryPath = Field(
+        default_factory=lambda: Path.cwd() / DEFAULT_CUSTOM_RULES_NAME
+    )
     include_rules: List[str] = Field(default_factory=list)
     exclude_rules: List[str] = Field(default_factory=list)
 
@@ -38,9 +80,20 @@ class SimpleConfig(BaseModel):
 
     dry_run: bool = False
     approval_mode: bool = True
-    approval_type: Literal["console", "image", "silent"] = "console"
-
-    hyperlint_dir: DirectoryPath = Field(default=Path(DEFAULT_HYPERLINT_STORAGE_DIR))
+    approval_type: Literal["console", "batch", "image", "silent"] = "console"
+    # Number of edits shown per prompt when approval_type is "batch"
+    approval_batch_size: int = Field(default=10, ge=1)
+    log_silent_approvals: bool = True
+    # Unreviewed decisions buffered per log file before they are written
+    log_flush_batch: int = Field(default=64, ge=1)
+    # Reuse earlier approval decisions for identical edits instead of prompting
+    cache_approvals: bool = False
+    # Number of line fixes requested from the model at the same time
+    fix_workers: int = Field(default=8, ge=1)
+
+    hyperlint_dir: DirectoryPath = Field(
+        default_factory=lambda: Path.cwd() / DEFAULT_HYPERLINT_STORAGE_NAME
+    )
     enabled_editors: List[Literal["vale", "custom_rules"]] = Field(
         default_factory=lambda: ["vale", "custom_rules"]  # type: ignore
     )
@@ -52,9 +105,12 @@ class SimpleConfig(BaseModel):
             logger.warning(f"Config file not found: {path}. Using defaults.")
             return cls()
 
+        import yaml
+
         try:
-            with open(path, "r") as f:
-                data = yaml.safe_load(f) or {}
+            # libyaml's C loader when available, same results as safe_load
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            data = yaml.load(path.read_text(), Loader=loader) or {}
 
             # Create config with data, using model validation
             return cls.model_validate(data)
@@ -105,32 +161,68 @@ class SimpleConfig(BaseModel):
             logger.info(f"Created storage data directory at {storage_data_dir}")
 
 
-def find_config_file() -> Optional[Path]:
-    """Find configuration file in standard locations"""
-    search_paths = [
-        Path.cwd() / "hyperlint.yaml",
-        Path.cwd() / ".hyperlint.yaml",
-        Path.home() / ".config" / "hyperlint" / "config.yaml",
-    ]
-
-    for path in search_paths:
-        if path.exists():
-            return path
+# Config file names looked for in the working directory, in order of preference
+_CWD_CONFIG_NAMES = ("hyperlint.yaml", ".hyperlint.yaml")
+
+
+# Working directory configs already found, keyed by directory and mtime
+_cwd_config_cache: Dict[Tuple[str, int], str] = {}
+
+
+def _find_cwd_config(cwd: str, cwd_mtime_ns: int) -> Optional[str]:
+    # Only hits are remembered: a missing config is searched for again on
+    # every call, so a new file is seen even if the directory mtime has not
+    # visibly changed. A hit is re-checked with one stat before reuse.
+    key = (cwd, cwd_mtime_ns)
+    found = _cwd_config_cache.get(key)
+    if found is not None and os.path.isfile(found):
+        return found
+
+    # One directory listing covers both working directory candidates
+    with os.scandir(cwd) as entries:
+        cwd_files = {
+            entry.name
+            for entry in entries
+            if entry.name in _CWD_CONFIG_NAMES and entry.is_file()
+        }
+    for name in _CWD_CONFIG_NAMES:
+        if name in cwd_files:
+            found = os.path.join(cwd, name)
+            if len(_cwd_config_cache) >= 4:
+                _cwd_config_cache.clear()
+            _cwd_config_cache[key] = found
+            return found
     return None
 
 
-def create_default_config(path: Path = DEFAULT_CONFIG_PATH) -> None:
-    """Create a default configuration file"""
+def find_config_file() -> Optional[Path]:
+    """
+    Find configuration file in standard locations.
 
-    # Create a default config and dump it to YAML
-    config = SimpleConfig()
-    yaml_str = yaml.dump(config.model_dump(), sort_keys=False)
+    A config found in the working directory is reused while the directory's
+    modification time is unchanged; the home config is checked on each call.
+    """
+    cwd = os.getcwd()
+    found = _find_cwd_config(cwd, os.stat(cwd).st_mtime_ns)
+    if found is None:
+        home_config = os.path.join(
+            os.path.expanduser("~"), ".config", "hyperlint", "config.yaml"
+        )
+        if os.path.isfile(home_config):
+            found = home_config
+    return Path(found) if found else None
+
+
+def default_config_path() -> Path:
+    """Return where `hyperlint init` writes the configuration file."""
+    return Path.cwd() / DEFAULT_CONFIG_NAME
 
-    # Add a header comment
-    final_content = "# Hyperlint Configuration\n" + yaml_str
 
-    with open(path, "w") as f:
-        f.write(final_content)
+def create_default_config(path: Optional[Path] = None) -> None:
+    """Create a default configuration file"""
+    if path is None:
+        path = default_config_path()
+    path.write_text(_DEFAULT_CONFIG_YAML)
 
 
 def create_default_rules(rules_dir: Path) -> None:
@@ -204,8 +296,21 @@ Ensure transitions make logical sense and enhance readability.""",
     for filename, content in default_rules.items():
         rule_path = rules_dir / filename
         if not rule_path.exists():
-            with open(rule_path, "w") as f:
-                f.write(content)
+            rule_path.write_text(content)
+
+
+@lru_cache(maxsize=8)
+def _load_config_file(path: str, mtime_ns: int, size: int) -> SimpleConfig:
+    # mtime_ns and size are only part of the cache key, so an edited file
+    # is re-read
+    return SimpleConfig.from_yaml(Path(path))
+
+
+def _load_cached_config(path: Path) -> SimpleConfig:
+    resolved = path.resolve()
+    stat = resolved.stat()
+    config = _load_config_file(str(resolved), stat.st_mtime_ns, stat.st_size)
+    return config.model_copy(deep=True)
 
 
 def load_config(config_path: Optional[Path] = None) -> SimpleConfig:
@@ -214,14 +319,32 @@ def load_config(config_path: Optional[Path] = None) -> SimpleConfig:
     1. Use specified config path if provided
     2. Search for config in standard locations
     3. Create default config if none found
+
+    Config files are parsed once per process and again only after they
+    change on disk. Each call returns its own copy, so callers may modify
+    the result freely.
     """
     if config_path and config_path.exists():
-        return SimpleConfig.from_yaml(config_path)
+        return _load_cached_config(config_path)
 
     # Find config in standard locations
     found_config = find_config_file()
     if found_config:
-        return SimpleConfig.from_yaml(found_config)
+        return _load_cached_config(found_config)
 
     # Use default config
     return SimpleConfig()
+
+
+def __getattr__(name: str) -> Path:
+    # Deprecated DEFAULT_*_PATH constants resolve against the current directory
+    if name in _DEPRECATED_PATH_NAMES:
+        file_name = _DEPRECATED_PATH_NAMES[name]
+        warnings.warn(
+            f"hyperlint.config.{name} is deprecated; use "
+            f"Path.cwd() / {file_name!r} instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return Path.cwd() / file_name
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
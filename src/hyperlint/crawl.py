@@ -1,5 +1,4 @@
 import asyncio
-import json
 from datetime import datetime
 from typing import Any, Dict, List
 from urllib.parse import urlparse
@@ -11,6 +10,7 @@ from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
 from loguru import logger
 
 from .config import SimpleConfig
+from .jsonio import dumps
 from .sources.storage import Page, SearchIndex
 
 
@@ -59,8 +59,7 @@ async def external_crawl(
             )
 
         metadata["pages"] = [page.model_dump() for page in pages]
-        with open(crawl_index_file, "w") as f:
-            json.dump(metadata, f)
+        crawl_index_file.write_bytes(dumps(metadata))
 
     return pages
 
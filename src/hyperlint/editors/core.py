@@ -1,28 +1,89 @@
 import difflib
 from abc import ABC, abstractmethod
-from collections import OrderedDict
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import instructor
 from litellm import completion
 from loguru import logger
-from pydantic import BaseModel, Field, FilePath
+from pydantic import BaseModel, Field, FilePath, PrivateAttr
 from rich.columns import Columns
 from rich.console import Console
 from rich.text import Text
 
-from ..approval import get_approval_log
+from ..approval import BatchEditorApprovalLog, get_approval_log
 from ..config import DEFAULT_EDIT_MODEL, DELETE_LINE_MESSAGE, SimpleConfig
 from ..utils import MDXParser
 
 patched_client = instructor.from_litellm(completion=completion)
 
 
-def diff(old: str, new: str):
-    diff = difflib.unified_diff(
-        old.splitlines(),
-        new.splitlines(),
-    )
+def _format_range(start: int, length: int) -> str:
+    # Same range format as difflib.unified_diff for non-empty ranges
+    return str(start + 1) if length == 1 else f"{start + 1},{length}"
+
+
+def _aligned_diff(
+    old_lines: List[str],
+    new_lines: List[str],
+    context: int = 3,
+    fromfile: str = "",
+    tofile: str = "",
+):
+    """
+    Unified diff lines for two texts with the same number of lines, compared
+    line by line in one linear pass instead of with difflib's matcher.
+    """
+    changed = [
+        index
+        for index, (old_line, new_line) in enumerate(zip(old_lines, new_lines))
+        if old_line != new_line
+    ]
+    if not changed:
+        return
+
+    # Changes closer together than two contexts' worth share a hunk
+    groups: List[List[int]] = [[changed[0]]]
+    for index in changed[1:]:
+        if index - groups[-1][-1] - 1 > 2 * context:
+            groups.append([index])
+        else:
+            groups[-1].append(index)
+
+    yield f"--- {fromfile}\n"
+    yield f"+++ {tofile}\n"
+    changed_set = set(changed)
+    for group in groups:
+        start = max(0, group[0] - context)
+        end = min(len(old_lines), group[-1] + context + 1)
+        hunk_range = _format_range(start, end - start)
+        yield f"@@ -{hunk_range} +{hunk_range} @@\n"
+        index = start
+        while index < end:
+            if index not in changed_set:
+                yield " " + old_lines[index]
+                index += 1
+                continue
+            run_end = index
+            while run_end < end and run_end in changed_set:
+                run_end += 1
+            for old_line in old_lines[index:run_end]:
+                yield "-" + old_line
+            for new_line in new_lines[index:run_end]:
+                yield "+" + new_line
+            index = run_end
+
+
+def diff(old: str, new: str, fromfile: str = "", tofile: str = ""):
+    old_lines = old.splitlines()
+    new_lines = new.splitlines()
+    if len(old_lines) == len(new_lines):
+        # Only lines were replaced, so a line-by-line comparison suffices
+        return "\n".join(
+            _aligned_diff(old_lines, new_lines, fromfile=fromfile, tofile=tofile)
+        )
+    diff = difflib.unified_diff(old_lines, new_lines, fromfile, tofile)
     return "\n".join(diff)
 
 
@@ -40,6 +101,29 @@ def get_issue_type(issue) -> str:
         return "unknown"
 
 
+# Prompt sent to the edit model by ReplaceLineFixableIssue.fix
+_FIX_CONTEXT_TEMPLATE = (
+    "Here is some context around the line in question\n"
+    "<context>\n{context}\n</context>\n"
+)
+_FIX_PROMPT_TEMPLATE = """Act as if you are a professional editor with 3 years of experience.
+
+{context}
+Rewrite the following line:
+
+<line number={line_number}>
+{existing_content}
+</line>
+
+To fix the following issue:
+
+<issue>
+{issues}
+</issue>
+
+Rewrite the entire line resolving the issue description. It is imperative to rewrite the entire line, even if the issue appears in a single word or part of the line. We are going to replace the entire above line so you must maintain the original line except for the fixes to the issues.
+"""
+
 class FixedLine(BaseModel):
     "The fix for a given line of content. It must include the entire line replaced, not just the partial fix."
 
@@ -67,30 +151,15 @@ class ReplaceLineFixableIssue(LineIssue):
             logger.debug(f"Fixing line issue: {issues_str}")
             context_str = ""
             if context:
-                context_str = (
-                    "Here is some context around the line in question\n<context>\n"
-                    + context
-                    + "\n</context>\n"
-                )
+                context_str = _FIX_CONTEXT_TEMPLATE.format(context=context)
 
             # Prepare prompt for Anthropic
-            prompt = f"""Act as if you are a professional editor with 3 years of experience.
-
-{context_str}
-Rewrite the following line:
-
-<line number={self.line}>
-{self.existing_content}
-</line>
-
-To fix the following issue:
-
-<issue>
-{issues_str}
-</issue>
-
-Rewrite the entire line resolving the issue description. It is imperative to rewrite the entire line, even if the issue appears in a single word or part of the line. We are going to replace the entire above line so you must maintain the original line except for the fixes to the issues.
-"""
+            prompt = _FIX_PROMPT_TEMPLATE.format(
+                context=context_str,
+                line_number=self.line,
+                existing_content=self.existing_content,
+                issues=issues_str,
+            )
 
             message = patched_client.chat.completions.create(
                 model=DEFAULT_EDIT_MODEL,
@@ -138,18 +207,31 @@ class BaseEditor(ABC, BaseModel):
     deletions: List[DeleteLineIssue] = Field(default_factory=list, repr=False)
     editor_type: str = "editor"
     is_mdx: bool = False
-    mdx_parser: Optional[MDXParser] = Field(default=None, repr=False)
+    # Derived views of the text, each stored with the text it was built from
+    _line_lookup_cache: Optional[Tuple[str, Dict[int, str]]] = PrivateAttr(
+        default=None
+    )
+    _numbered_text_cache: Optional[Tuple[str, str]] = PrivateAttr(default=None)
 
     def model_post_init(self, __context: Any, /) -> None:
-        """Initialize MDX parser if file is MDX."""
+        """Detect whether the file is MDX."""
         self.is_mdx = self.path.suffix.lower() == ".mdx"
-        if self.is_mdx:
-            self.mdx_parser = MDXParser(content=self.get_text())
+
+    @cached_property
+    def mdx_parser(self) -> Optional[MDXParser]:
+        """
+        Parse the document's MDX structure on first use.
+
+        Returns:
+            Optional[MDXParser]: The parser for MDX files, otherwise None.
+        """
+        if not self.is_mdx:
+            return None
+        return MDXParser(content=self.get_text())
 
     def get_text(self) -> str:
         if self.text is None:
-            with open(self.path, "r") as f:
-                self.text = f.read()
+            self.text = self.path.read_text()
         return self.text
 
     def get_approval_log(self):
@@ -178,31 +260,64 @@ class BaseEditor(ABC, BaseModel):
         pass
 
     def get_line_number_lookup(self) -> Dict[int, str]:
-        return OrderedDict(
-            (line_number, line_content)
-            for line_number, line_content in enumerate(self.get_text().split("\n"), 1)
-        )
+        """
+        Map each line number to its content.
+
+        The mapping is built once per version of the text and shared between
+        callers, so copy it before making changes.
+        """
+        text = self.get_text()
+        cached = self._line_lookup_cache
+        if cached is None or cached[0] is not text:
+            lookup = dict(enumerate(text.split("\n"), 1))
+            cached = self._line_lookup_cache = (text, lookup)
+        return cached[1]
 
     def get_text_with_line_numbers(self) -> str:
-        return "\n".join(
-            [
-                f"{line_number}: {line_content}"
-                for line_number, line_content in self.get_line_number_lookup().items()
-            ]
-        )
+        text = self.get_text()
+        cached = self._numbered_text_cache
+        if cached is None or cached[0] is not text:
+            lookup = self.get_line_number_lookup()
+            numbered = "\n".join(
+                [
+                    f"{line_number}: {line_content}"
+                    for line_number, line_content in lookup.items()
+                ]
+            )
+            cached = self._numbered_text_cache = (text, numbered)
+        return cached[1]
 
-    def _approval_filter(
-        self,
-        issue: ReplaceLineFixableIssue | DeleteLineIssue | InsertLineIssue,
-        proposed_fix: str,
+    def _is_protected(
+        self, issue: ReplaceLineFixableIssue | DeleteLineIssue | InsertLineIssue
     ) -> bool:
         # Check if line is in MDX protected region
         if self.is_mdx and self.mdx_parser:
             line_number = getattr(issue, 'line', None)
             if line_number and self.mdx_parser.is_protected_line(line_number):
                 logger.warning(f"Skipping protected MDX line {line_number}")
-                return False
-        
+                return True
+        return False
+
+    def _approval_context(
+        self,
+        issue: ReplaceLineFixableIssue | DeleteLineIssue | InsertLineIssue,
+        proposed_fix: str,
+    ) -> Dict[str, Any]:
+        # Create context dictionary for approval log
+        return {
+            'issue': issue,
+            'proposed_fix': proposed_fix,
+            'file_path': str(self.path)
+        }
+
+    def _approval_filter(
+        self,
+        issue: ReplaceLineFixableIssue | DeleteLineIssue | InsertLineIssue,
+        proposed_fix: str,
+    ) -> bool:
+        if self._is_protected(issue):
+            return False
+
         if self.config.dry_run:
             logger.debug("Is dry run, approving")
             return True
@@ -210,16 +325,42 @@ class BaseEditor(ABC, BaseModel):
             logger.debug("does not require approval")
             return True
 
-        # Create context dictionary for approval log
-        context = {
-            'issue': issue,
-            'proposed_fix': proposed_fix,
-            'file_path': str(self.path)
-        }
+        context = self._approval_context(issue, proposed_fix)
         approved = self.get_approval_log().prompt_for_approval(context)
 
         return approved
 
+    def _approval_filter_many(
+        self,
+        proposals: Sequence[
+            Tuple[ReplaceLineFixableIssue | DeleteLineIssue | InsertLineIssue, str]
+        ],
+    ) -> List[bool]:
+        """
+        Approve several proposed fixes, letting a batch approval log prompt for
+        all of them at once. Other approval logs are asked one fix at a time.
+        """
+        approval_log = self.get_approval_log()
+        if (
+            self.config.dry_run
+            or not self.config.approval_mode
+            or not isinstance(approval_log, BatchEditorApprovalLog)
+        ):
+            return [self._approval_filter(issue, fix) for issue, fix in proposals]
+
+        approvals = [False] * len(proposals)
+        pending = [
+            index
+            for index, (issue, _) in enumerate(proposals)
+            if not self._is_protected(issue)
+        ]
+        decisions = approval_log.prompt_for_approvals(
+            [self._approval_context(*proposals[index]) for index in pending]
+        )
+        for index, approved in zip(pending, decisions):
+            approvals[index] = approved
+        return approvals
+
     def _compress_issues(self):
         # Compress issues by line number
         compressed_issues: Dict[int, List[ReplaceLineFixableIssue]] = {}
@@ -234,74 +375,97 @@ class BaseEditor(ABC, BaseModel):
         return compressed_issues
 
     def _get_surrounding_lines(
-        self, line_number: int, line_count: int, line_lookup: Dict[int, str]
+        self, line_number: int, line_count: int, lines: List[str]
     ) -> List[str]:
-        # Get surrounding lines for a given line number
-        surrounding_lines: List[str] = []
-        # Determine the range of lines to include
+        # Get surrounding lines for a given line number, where lines[0] is line 1
         start_line = max(1, line_number - line_count)
-        end_line = line_number + line_count + 1
-
-        # Collect all lines in range
-        for line_no in range(start_line, end_line):
-            if line_no in line_lookup:
-                surrounding_lines.append(f"{line_no}: {line_lookup[line_no]}")
+        window = lines[start_line - 1 : line_number + line_count]
+        return [
+            f"{line_no}: {line_content}"
+            for line_no, line_content in enumerate(window, start_line)
+        ]
+
+    def _fix_all(
+        self, tasks: List[Tuple[ReplaceLineFixableIssue, str]]
+    ) -> List[str]:
+        """
+        Ask for a fix for each (issue, context) pair, returning them in order.
 
-        return surrounding_lines
+        Each fix is an independent model call, so up to config.fix_workers of
+        them run at once.
+        """
+        workers = min(self.config.fix_workers, len(tasks))
+        if workers <= 1:
+            return [issue.fix(context) for issue, context in tasks]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda task: task[0].fix(task[1]), tasks))
 
     def generate_v2(self) -> str:
         self.get_text()
         self.collect_issues()
         compressed_issues = self._compress_issues()
-        initial_line_lookup = self.get_line_number_lookup()
+        # Copied because approved changes are written into it below
+        initial_line_lookup = dict(self.get_line_number_lookup())
+        original_lines = list(initial_line_lookup.values())
         changes: Dict[int, str] = {}  # Store results of fixes/deletions
 
-        # Process all issues for each line
+        # Propose a fix for every line with issues, using the original text
+        # as context, then approve the proposals together
+        fix_tasks: List[Tuple[ReplaceLineFixableIssue, str]] = []
         for line_no, line_issues in compressed_issues.items():
+            # Drop repeated messages, keeping them in the order they were found
             issues = list(
-                set([msg for issue in line_issues for msg in issue.issue_message])
+                dict.fromkeys(
+                    msg for issue in line_issues for msg in issue.issue_message
+                )
             )
             logger.debug(f"Fixing {len(issues)} issues on line {line_no}")
             deduped_issue = line_issues[0]
             deduped_issue.issue_message = issues
             context = "\n".join(
-                self._get_surrounding_lines(line_no, 5, initial_line_lookup)
+                self._get_surrounding_lines(line_no, 5, original_lines)
             )
-            proposed_fix = deduped_issue.fix(context)
-            approved = self._approval_filter(deduped_issue, proposed_fix)
-            if approved and proposed_fix != initial_line_lookup[line_no]:
-                changes[line_no] = proposed_fix
-                initial_line_lookup[line_no] = proposed_fix
+            fix_tasks.append((deduped_issue, context))
+        proposals = [
+            (issue, proposed_fix)
+            for (issue, _), proposed_fix in zip(fix_tasks, self._fix_all(fix_tasks))
+        ]
+
+        for (issue, proposed_fix), approved in zip(
+            proposals, self._approval_filter_many(proposals)
+        ):
+            if approved and proposed_fix != initial_line_lookup[issue.line]:
+                changes[issue.line] = proposed_fix
+                initial_line_lookup[issue.line] = proposed_fix
 
         # Process deletions
-        for issue in self.deletions:
-            approved = self._approval_filter(issue, "TO DELETE")
+        deletion_approvals = self._approval_filter_many(
+            [(issue, "TO DELETE") for issue in self.deletions]
+        )
+        for delete_issue, approved in zip(self.deletions, deletion_approvals):
             if approved:
-                changes[issue.line] = DELETE_LINE_MESSAGE
-                initial_line_lookup[issue.line] = (
+                changes[delete_issue.line] = DELETE_LINE_MESSAGE
+                initial_line_lookup[delete_issue.line] = (
                     DELETE_LINE_MESSAGE  # Mark for deletion
                 )
 
         final_lines: List[str] = []
         sorted_insertions = sorted(self.insertions, key=lambda x: x.line)
-        insertion_idx = 0
-
-        # Iterate through original lines, applying changes and insertions
-        for line_no, original_content in sorted(initial_line_lookup.items()):
-            # Process insertions BEFORE this line number
-            while (
-                insertion_idx < len(sorted_insertions)
-                and sorted_insertions[insertion_idx].line == line_no
-            ):
-                insert_issue = sorted_insertions[insertion_idx]
-                approved = self._approval_filter(
-                    insert_issue, insert_issue.insert_content
+        insertion_approvals = self._approval_filter_many(
+            [(issue, issue.insert_content) for issue in sorted_insertions]
+        )
+        # Group the approved insertions by the line they go before
+        insertions_by_line: Dict[int, List[str]] = {}
+        for insert_issue, approved in zip(sorted_insertions, insertion_approvals):
+            if approved:
+                insertions_by_line.setdefault(insert_issue.line, []).append(
+                    insert_issue.insert_content
                 )
-                # Apply the insertion if approved
-                if approved:
-                    final_lines.append(insert_issue.insert_content)
 
-                insertion_idx += 1
+        # Line numbers run from 1 without gaps, so walk them in order
+        for line_no in range(1, len(initial_line_lookup) + 1):
+            # Process insertions BEFORE this line number
+            final_lines.extend(insertions_by_line.pop(line_no, ()))
 
             # Process change/deletion for this line number
             if line_no in changes:
@@ -311,17 +475,11 @@ class BaseEditor(ABC, BaseModel):
                 # else: line is deleted, do nothing
             else:
                 # No change, keep original content
-                final_lines.append(original_content)
+                final_lines.append(initial_line_lookup[line_no])
 
         # Handle any insertions that should occur after the last line
-        while insertion_idx < len(sorted_insertions):
-            insert_issue = sorted_insertions[insertion_idx]
-
-            approved = self._approval_filter(insert_issue, insert_issue.insert_content)
-            if approved:
-                final_lines.append(insert_issue.insert_content)
-
-            insertion_idx += 1
+        for line_no in sorted(insertions_by_line):
+            final_lines.extend(insertions_by_line[line_no])
 
         self.text = "\n".join(final_lines)
         return self.get_text()
@@ -347,21 +505,19 @@ class BaseEditor(ABC, BaseModel):
         ).lower().strip() in ("y", "yes")
 
         if approved:
-            with open(path, "w") as f:
-                f.write(final_content)
+            path.write_text(final_content)
 
         return path
 
-    def dry_run(self):
+    def dry_run(self) -> str:
+        """Return the proposed changes as a unified diff without applying them."""
         # Ensure dry run mode is active
         old_dry_run = self.config.dry_run
         self.config.dry_run = True
 
-        path = self.path
         original_text = self.get_text()
         final_content = self.generate_v2()
-        print(diff(original_text, final_content))
 
         # Restore original dry run setting
         self.config.dry_run = old_dry_run
-        return path
+        return diff(original_text, final_content, str(self.path), str(self.path))
@@ -1,4 +1,5 @@
 import os
+from functools import cached_property
 from typing import Dict, List, Literal
 
 import dspy  # type: ignore
@@ -117,12 +118,12 @@ class RulesEditor(BaseEditor):
         rules = {}
         rules_dir = self.config.custom_rules.rules_directory
 
-        for file_path in rules_dir.glob("*.md"):
+        for file_path in rules_dir.iterdir():
+            if file_path.suffix != ".md" or not file_path.is_file():
+                continue
             rule_name = file_path.stem
             try:
-                with open(file_path, "r") as f:
-                    rule_content = f.read()
-                rules[rule_name] = rule_content
+                rules[rule_name] = file_path.read_text()
                 logger.info(f"Loaded rule: {rule_name}")
             except Exception as e:
                 logger.error(f"Error loading rule {rule_name}: {e}")
@@ -150,10 +151,11 @@ class RulesEditor(BaseEditor):
                     logger.warning(f"Included rule not found: {rule_name}")
         else:
             # Otherwise, include all rules except those in config.exclude_rules
+            excluded = frozenset(self.config.custom_rules.exclude_rules)
             filtered_rules = {
                 rule_name: rule_content
                 for rule_name, rule_content in rules.items()
-                if rule_name not in self.config.custom_rules.exclude_rules
+                if rule_name not in excluded
             }
 
             # Log excluded rules
@@ -165,6 +167,22 @@ class RulesEditor(BaseEditor):
 
         return filtered_rules
 
+    @cached_property
+    def _filtered_rules(self) -> Dict[str, str]:
+        """
+        Load and filter the rules once per editor instance.
+
+        Returns:
+            Dict[str, str]: Filtered dictionary of rule name to rule content.
+        """
+        rules = self._load_rules()
+        logger.debug(f"Loaded {len(rules)} rules")
+        return self._filter_rules(rules)
+
+    def refresh(self) -> None:
+        """Drop the cached rule set so it is reloaded on the next run."""
+        self.__dict__.pop("_filtered_rules", None)
+
     def apply_rule(self, rule_content: str, rule_name: str) -> None:
         """
         Apply a single rule to the document using AI.
@@ -222,11 +240,8 @@ class RulesEditor(BaseEditor):
         Load rules, filter them, and apply them to the document.
         Only runs if there are rules available.
         """
-        # Load all rules
-        rules = self._load_rules()
-        logger.debug(f"Loaded {len(rules)} rules")
-        # Filter rules based on include/exclude lists
-        filtered_rules = self._filter_rules(rules)
+        # Load and filter rules based on include/exclude lists
+        filtered_rules = self._filtered_rules
 
         if not filtered_rules:
             logger.warning("No rules to apply after filtering")
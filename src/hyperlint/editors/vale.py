@@ -1,23 +1,28 @@
-import json
+import functools
 import os
+import shutil
 import subprocess
 import tempfile
 from dataclasses import dataclass, field
-from typing import Any, List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 from loguru import logger
+from pydantic import Field
 
 from ..approval import EditorApprovalLog
+from ..config import SimpleConfig
+from ..jsonio import loads
 from .core import BaseEditor, LineIssue, ReplaceLineFixableIssue
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionC:
     Name: str = ""
     Params: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValeAlert:
     Action: ActionC = field(default_factory=ActionC)
     Span: List[int] = field(default_factory=list)
@@ -36,7 +41,7 @@ class ValeAlert:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ValeFileReport:
     issues: List[ValeAlert] = field(default_factory=list)
 
@@ -44,103 +49,191 @@ class ValeFileReport:
         return [alert.as_line_issue() for alert in self.issues]
 
 
+# Bytes of file paths passed to one Vale process. Well below ARG_MAX on
+# POSIX systems and the 32K character command line limit on Windows
+_MAX_ARGV_BYTES = 30_000
+
+
+def _chunk_paths(paths: List[str], max_bytes: int = _MAX_ARGV_BYTES):
+    """Split paths into chunks whose combined argument size stays under max_bytes."""
+    chunk: List[str] = []
+    size = 0
+    for path in paths:
+        path_size = len(os.fsencode(path)) + 1
+        if chunk and size + path_size > max_bytes:
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(path)
+        size += path_size
+    if chunk:
+        yield chunk
+
+
+@functools.cache
+def _vale_path() -> Optional[str]:
+    """Resolve the Vale binary once per process."""
+    return shutil.which("vale")
+
+
 def check_vale_installation() -> bool:
-    try:
-        # Run 'vale --version' and capture the output
-        _ = subprocess.run(
-            ["vale", "--version"],
-            check=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
+    # If 'vale' is not found, Vale is not installed or not in PATH
+    return _vale_path() is not None
+
+
+def _alerts_to_line_issues(alerts: List[dict]) -> List[LineIssue]:
+    """Convert Vale's JSON alerts for a single file into line issues."""
+    issues = []
+    for alert in alerts:
+        action = ActionC(
+            Name=alert.get("Action", {}).get("Name", ""),
+            Params=alert.get("Action", {}).get("Params"),
+        )
+        issues.append(
+            ValeAlert(
+                Action=action,
+                Span=alert.get("Span", []),
+                Check=alert.get("Check", ""),
+                Description=alert.get("Description", ""),
+                Link=alert.get("Link", ""),
+                Message=alert.get("Message", ""),
+                Severity=alert.get("Severity", ""),
+                Match=alert.get("Match", ""),
+                Line=alert.get("Line", 0),
+            )
         )
-        # If the command runs successfully, Vale is installed
-        return True
-    except FileNotFoundError:
-        # If 'vale' command is not found, Vale is not installed or not in PATH
-        return False
-    except subprocess.CalledProcessError as e:
-        # Handle other potential errors during the command execution
-        logger.error(f"Error checking Vale installation: {e}")
-        return False
+
+    report = ValeFileReport(issues=issues)
+    logger.success("Vale Report", report=report)
+    return report.as_line_issues()
+
+
+def _run_vale_on_files(
+    vale_path: str, files: Dict[str, Path], vale_config_path: str, vale_dir: str
+) -> Dict[Path, List[LineIssue]]:
+    """
+    Run one Vale process over files already on disk.
+
+    Args:
+        vale_path: Path to the Vale binary.
+        files: Mapping of absolute file path to the source path its issues
+            are reported under.
+        vale_config_path: Path to the Vale configuration file.
+        vale_dir: Working directory for the Vale process.
+
+    Returns:
+        Mapping of each source path to the issues Vale reported for it.
+    """
+    results: Dict[Path, List[LineIssue]] = {path: [] for path in files.values()}
+    vale_output = subprocess.run(
+        [vale_path, "--config", vale_config_path, "--output=JSON", *files],
+        capture_output=True,
+        text=True,
+        cwd=vale_dir,
+        env=dict(os.environ, PATH=os.environ.get("PATH", "")),
+    )
+
+    logger.success("Vale Result", result=vale_output)
+    # Parse the JSON output
+    as_json = loads(vale_output.stdout)
+    logger.success("Vale JSON", json=as_json)
+
+    # Fan the alerts back out to the documents they belong to
+    for file_path, alerts in as_json.items():
+        source_path = files.get(os.path.abspath(os.path.join(vale_dir, file_path)))
+        if source_path is None:
+            logger.warning(f"Vale reported alerts for unknown file {file_path}")
+            continue
+        logger.info(f"Found {len(alerts)} alerts in {source_path}")
+        results[source_path] = _alerts_to_line_issues(alerts)
+
+    return results
 
 
 def run_vale(text: str, vale_config_path: str, is_mdx: bool = False) -> List[LineIssue]:
-    if not check_vale_installation():
+    """
+    Lint a single document by writing it to a temporary document.md (or
+    document.mdx) under PROJECT_ROOT.
+
+    Vale sees the temporary path rather than the document's own, so
+    .vale.ini sections scoped to directories or file names do not apply;
+    only the global and extension-wide sections do. ValeEditor.run_batch
+    lints files at their real paths.
+    """
+    vale_path = _vale_path()
+    if vale_path is None:
         logger.error("Vale is not installed or not found in PATH")
         return []
 
     vale_dir = os.environ.get("PROJECT_ROOT", os.getcwd())
-
-    # Create a temporary file and ensure it's written and closed
-    suffix = ".mdx" if is_mdx else ".md"
-    with tempfile.NamedTemporaryFile(
-        dir=vale_dir, mode="w", suffix=suffix, delete=False
-    ) as temp_file:
-        temp_file.write(text)
-        temp_file_path = temp_file.name
+    source_path = Path("document.mdx" if is_mdx else "document.md")
 
     try:
-        # Get the full path to vale
-        vale_path = subprocess.check_output(["which", "vale"]).decode().strip()
-
-        # Run vale with the correct working directory and environment
-        vale_output = subprocess.run(
-            [vale_path, "--config", vale_config_path, "--output=JSON", temp_file_path],
-            capture_output=True,
-            text=True,
-            cwd=vale_dir,
-            env=dict(os.environ, PATH=os.environ.get("PATH", "")),
-        )
-
-        logger.success("Vale Result", result=vale_output)
-        # Parse the JSON output
-        as_json = json.loads(vale_output.stdout)
-        logger.success("Vale JSON", json=as_json)
-
-        # Convert JSON alerts into ValeAlert objects
-        issues = []
-        for file_path, alerts in as_json.items():
-            logger.info(f"Found {len(alerts)} alerts in {file_path}")
-            for alert in alerts:
-                action = ActionC(
-                    Name=alert.get("Action", {}).get("Name", ""),
-                    Params=alert.get("Action", {}).get("Params"),
-                )
-                issues.append(
-                    ValeAlert(
-                        Action=action,
-                        Span=alert.get("Span", []),
-                        Check=alert.get("Check", ""),
-                        Description=alert.get("Description", ""),
-                        Link=alert.get("Link", ""),
-                        Message=alert.get("Message", ""),
-                        Severity=alert.get("Severity", ""),
-                        Match=alert.get("Match", ""),
-                        Line=alert.get("Line", 0),
-                    )
-                )
-
-        report = ValeFileReport(issues=issues)
-        logger.success("Vale Report", report=report)
-        return report.as_line_issues()
+        # The directory and the file in it are removed when the block exits
+        with tempfile.TemporaryDirectory(dir=vale_dir) as temp_dir:
+            temp_file_path = os.path.abspath(os.path.join(temp_dir, source_path.name))
+            Path(temp_file_path).write_text(text)
+            results = _run_vale_on_files(
+                vale_path, {temp_file_path: source_path}, vale_config_path, vale_dir
+            )
+        return results[source_path]
 
     except Exception as e:
         logger.exception("Error running Vale", error=e)
         return []
-    finally:
-        # Clean up the temporary file
-        try:
-            os.remove(temp_file_path)
-        except Exception as e:
-            logger.exception("Error removing temporary file", error=e)
 
 
 class ValeEditor(BaseEditor):
+    # Issues already produced by a batched Vale run (see run_batch)
+    vale_issues: Optional[List[LineIssue]] = Field(default=None, repr=False)
+
     def model_post_init(self, context: Any, /) -> None:
         super().model_post_init(context)
         self.approval_log = EditorApprovalLog(self.config)
 
+    @classmethod
+    def run_batch(
+        cls, paths: List[Path], config: SimpleConfig
+    ) -> Dict[Path, List[LineIssue]]:
+        """
+        Lint several files in place, with one Vale process per chunk of paths
+        that fits on a command line.
+
+        The result for each path can be passed to the editor for that file
+        as ``vale_issues`` so it does not run Vale again. Paths whose Vale run
+        failed are left out, so their editors lint them with run_vale.
+
+        Files are linted at their real paths, so path-scoped .vale.ini
+        sections apply here but not to run_vale's temporary document.
+        """
+        results: Dict[Path, List[LineIssue]] = {}
+        if not paths:
+            return results
+
+        vale_path = _vale_path()
+        if vale_path is None:
+            logger.error("Vale is not installed or not found in PATH")
+            return results
+
+        vale_dir = os.environ.get("PROJECT_ROOT", os.getcwd())
+        files = {os.path.abspath(path): path for path in paths}
+        for chunk in _chunk_paths(list(files), _MAX_ARGV_BYTES):
+            try:
+                results.update(
+                    _run_vale_on_files(
+                        vale_path,
+                        {file: files[file] for file in chunk},
+                        str(config.vale.config_path),
+                        vale_dir,
+                    )
+                )
+            except Exception as e:
+                logger.exception(
+                    f"Error running Vale on {len(chunk)} files; "
+                    "they will be linted one at a time",
+                    error=e,
+                )
+        return results
+
     def prerun_checks(self) -> bool:
         vale_installed = check_vale_installation()
         config_path = self.config.vale.config_path
@@ -149,8 +242,11 @@ class ValeEditor(BaseEditor):
 
     def collect_issues(self) -> None:
         """Runs Vale and adds any reported issues as replacement issues."""
-        config_path = self.config.vale.config_path
-        issues = run_vale(self.get_text(), str(config_path), self.is_mdx)
+        if self.vale_issues is not None:
+            issues = self.vale_issues
+        else:
+            config_path = self.config.vale.config_path
+            issues = run_vale(self.get_text(), str(config_path), self.is_mdx)
         if not issues:
             logger.info("Vale reported no issues.")
             return
@@ -165,18 +261,20 @@ class ValeEditor(BaseEditor):
                 continue
                 
             # Ensure the line number from Vale is valid
-            if issue.line in line_lookup:
-                replacement_issue = ReplaceLineFixableIssue(
-                    line=issue.line,
-                    issue_message=issue.issue_message,
-                    existing_content=line_lookup[issue.line],
-                )
-                self.add_replacement(replacement_issue)
-                replacements_count += 1
-            else:
+            existing_content = line_lookup.get(issue.line)
+            if existing_content is None:
                 logger.warning(
                     f"Skipping Vale issue for line {issue.line} as it's not in the lookup (maybe out of bounds?). Message: {issue.issue_message}"
                 )
+                continue
+
+            replacement_issue = ReplaceLineFixableIssue(
+                line=issue.line,
+                issue_message=issue.issue_message,
+                existing_content=existing_content,
+            )
+            self.add_replacement(replacement_issue)
+            replacements_count += 1
 
         logger.success(
             f"Collected {replacements_count} line replacement issues from Vale."
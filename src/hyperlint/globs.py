@@ -0,0 +1,71 @@
+"""
+Glob pattern matching over POSIX-style relative paths.
+
+Patterns follow pathlib's rules: "*" and "?" stay within one path
+segment, "**" spans any number of directories, and a relative pattern
+matches the end of a path, so "*.md" matches markdown files at any depth
+and "drafts/*.md" matches files directly inside any drafts directory.
+"""
+
+import re
+
+
+def _translate_segment(segment: str) -> str:
+    parts = []
+    i, n = 0, len(segment)
+    while i < n:
+        char = segment[i]
+        i += 1
+        if char == "*":
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[":
+            # Find the end of the character class; "]" right after "[" or
+            # "[!" is part of the class
+            j = i
+            if j < n and segment[j] == "!":
+                j += 1
+            if j < n and segment[j] == "]":
+                j += 1
+            while j < n and segment[j] != "]":
+                j += 1
+            if j >= n:
+                parts.append(re.escape(char))
+                continue
+            body = segment[i:j]
+            i = j + 1
+            negate = body.startswith("!")
+            if negate:
+                body = body[1:]
+            # Escape what the regex class syntax would read differently
+            body = re.sub(r"([\\&~|])", r"\\\1", body)
+            if body.startswith("^"):
+                body = "\\" + body
+            # A class never matches the separator, even through a range
+            parts.append(f"(?!/)[{'^' if negate else ''}{body}]")
+        else:
+            parts.append(re.escape(char))
+    return "".join(parts)
+
+
+def translate(pattern: str) -> str:
+    """
+    Translate a glob pattern into a regex matching the end of a POSIX path.
+
+    Args:
+        pattern: Glob pattern, e.g. "*.md", "drafts/*.md" or "node_modules/**".
+
+    Returns:
+        Regex source anchored at the end of the path.
+    """
+    segments = pattern.split("/")
+    parts = []
+    for index, segment in enumerate(segments):
+        last = index == len(segments) - 1
+        if segment == "**":
+            # Any number of directories, or anything at all at the end
+            parts.append(".*" if last else "(?:[^/]+/)*")
+        else:
+            parts.append(_translate_segment(segment) + ("" if last else "/"))
+    return "(?s:(?:.*/)?" + "".join(parts) + r")\Z"
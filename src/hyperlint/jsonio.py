@@ -0,0 +1,37 @@
+"""
+JSON encoding helpers shared by the approval logs, editors and crawler.
+
+orjson is used when it is installed; otherwise the standard library json
+module produces the same compact output.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, Path):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object to a compact UTF-8 encoded JSON document."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default)
+    return json.dumps(
+        obj, default=_default, separators=(",", ":"), ensure_ascii=False
+    ).encode()
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
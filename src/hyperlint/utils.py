@@ -1,11 +1,23 @@
+import os
 import re
+import statistics
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Callable, Dict, List, Set, Tuple
 
 import spacy
 from pydantic import BaseModel
 
+from .globs import translate
+
+_JSX_COMPONENT_START_RE = re.compile(r"^\s*<([A-Z]\w*)")
+_CODE_FENCE = "```"
+_BRACES_RE = re.compile(r"\{([^{}]*)\}")
+_INLINE_CODE_RE = re.compile(r"`[^`]*`")
+_WORD_RE = re.compile(r"\S+")
+
 
 class MDXParser(BaseModel):
     """Parser for MDX files that identifies JSX components and protected regions."""
@@ -13,12 +25,18 @@ class MDXParser(BaseModel):
     content: str
     lines: List[str] = []
     protected_regions: List[Tuple[int, int]] = []  # (start_line, end_line)
+    protected_lines: Set[int] = set()
     
     def model_post_init(self, __context) -> None:
         """Initialize after Pydantic validation."""
         self.lines = self.content.splitlines()
         self.protected_regions = []
         self._identify_protected_regions()
+        self.protected_lines = {
+            line_number
+            for start, end in self.protected_regions
+            for line_number in range(start, end + 1)
+        }
     
     def _identify_protected_regions(self):
         """Identify JSX components, imports, exports, and expressions."""
@@ -40,7 +58,7 @@ class MDXParser(BaseModel):
                 continue
             
             # Check for JSX component start (lines starting with < that aren't HTML-like)
-            jsx_start_match = re.match(r'^\s*<([A-Z]\w*)', line)
+            jsx_start_match = _JSX_COMPONENT_START_RE.match(line)
             if jsx_start_match and not in_jsx_block:
                 component_name = jsx_start_match.group(1)
                 in_jsx_block = True
@@ -56,7 +74,7 @@ class MDXParser(BaseModel):
                     continue
                 
                 # Check if it's a single-line component with opening and closing tags
-                if re.search(rf'</{component_name}>', line):
+                if f"</{component_name}>" in line:
                     self.protected_regions.append((jsx_start_line, line_idx))
                     in_jsx_block = False
                     jsx_start_line = None
@@ -78,7 +96,7 @@ class MDXParser(BaseModel):
             # When in JSX block, check for closing tag
             if in_jsx_block and component_name:
                 # Check for closing tag
-                if re.match(rf'^\s*</{component_name}>', line):
+                if stripped_line.startswith(f"</{component_name}>"):
                     self.protected_regions.append((jsx_start_line, line_idx))
                     in_jsx_block = False
                     jsx_start_line = None
@@ -86,18 +104,42 @@ class MDXParser(BaseModel):
     
     def is_protected_line(self, line_number: int) -> bool:
         """Check if a line is within a protected region."""
-        for start, end in self.protected_regions:
-            if start <= line_number <= end:
-                return True
-        return False
+        return line_number in self.protected_lines
     
     def get_protected_regions(self) -> List[Tuple[int, int]]:
         """Return list of protected regions as (start_line, end_line) tuples."""
         return self.protected_regions.copy()
 
 
+# Pipeline components each helper can skip loading
+_SENTENCE_EXCLUDE = ("tagger", "parser", "attribute_ruler", "lemmatizer", "ner")
+_POS_EXCLUDE = ("parser", "lemmatizer", "ner")
+_LEXICAL_EXCLUDE = ("tok2vec",) + _SENTENCE_EXCLUDE
+
+
+@lru_cache(maxsize=8)
+def _get_nlp(model_name: str = "en_core_web_sm", exclude: Tuple[str, ...] = ()):
+    """Load a spaCy model once per process and reuse it across calls.
+
+    Args:
+        model_name: spaCy language model to load
+        exclude: Pipeline components to leave out of the loaded model
+
+    Returns:
+        The loaded spaCy Language object.
+    """
+    nlp = spacy.load(model_name, exclude=list(exclude))
+    # Without the dependency parser, fall back to the rule-based sentencizer
+    if "parser" in exclude and not (
+        nlp.has_pipe("senter") or nlp.has_pipe("sentencizer")
+    ):
+        nlp.add_pipe("sentencizer")
+    return nlp
+
+
 def get_word_counts(text: str) -> list[tuple[str, int]]:
-    words = text.lower().split()
+    # Lowercase word by word so large texts are never copied or split up front
+    words = (match.group().lower() for match in _WORD_RE.finditer(text))
     return Counter(words).most_common(20)
 
 
@@ -110,7 +152,21 @@ def remove_code_blocks(text: str) -> str:
     Returns:
         The string with code blocks removed.
     """
-    return re.sub(r"```.*?```", "", text, flags=re.DOTALL)
+    # Single forward scan pairing each opening fence with the next one,
+    # equivalent to re.sub(r"```.*?```", "", text, flags=re.DOTALL)
+    kept: List[str] = []
+    position = 0
+    while True:
+        start = text.find(_CODE_FENCE, position)
+        if start == -1:
+            break
+        end = text.find(_CODE_FENCE, start + len(_CODE_FENCE))
+        if end == -1:
+            break
+        kept.append(text[position:start])
+        position = end + len(_CODE_FENCE)
+    kept.append(text[position:])
+    return "".join(kept)
 
 
 def remove_inline_code(text: str) -> str:
@@ -122,15 +178,32 @@ def remove_inline_code(text: str) -> str:
     Returns:
         The string with inline code removed.
     """
-    return re.sub(r"`[^`]*`", "", text)
+    return _INLINE_CODE_RE.sub("", text)
+
+
+def _analyze(text: str, strip_code: bool = False):
+    """
+    Run the sentence pipeline over text once so callers can share the Doc.
+
+    Args:
+        text: The input text.
+        strip_code: Whether to remove code blocks and inline code first.
+
+    Returns:
+        The spaCy Doc for the text.
+    """
+    if strip_code:
+        text = remove_code_blocks(text)
+        text = remove_inline_code(text)
+    nlp = _get_nlp("en_core_web_sm", _SENTENCE_EXCLUDE)
+    return nlp(text)
 
 
 def get_sentences(text: str) -> list[str]:
     """
     Returns a list of sentences from the given text.
     """
-    nlp = spacy.load("en_core_web_sm")
-    doc = nlp(text)
+    doc = _analyze(text)
     return [sentence.text for sentence in doc.sents]
 
 
@@ -144,8 +217,7 @@ def calculate_sentence_lengths(text: str) -> list[int]:
     Returns:
         A list of sentence lengths.
     """
-    nlp = spacy.load("en_core_web_sm")
-    doc = nlp(text)
+    doc = _analyze(text)
     return [len(sentence) for sentence in doc.sents]
 
 
@@ -159,9 +231,8 @@ def get_sentence_length_stats(text: str) -> dict[str, float]:
     Returns:
         A dictionary containing the min, max, average, and median sentence lengths.
     """
-    text = remove_code_blocks(text)
-    text = remove_inline_code(text)
-    sentence_lengths = calculate_sentence_lengths(text)
+    doc = _analyze(text, strip_code=True)
+    sentence_lengths = [len(sentence) for sentence in doc.sents]
     if not sentence_lengths:
         return {
             "min": 0.0,
@@ -172,16 +243,7 @@ def get_sentence_length_stats(text: str) -> dict[str, float]:
     min_length = min(sentence_lengths)
     max_length = max(sentence_lengths)
     average_length = sum(sentence_lengths) / len(sentence_lengths)
-    sorted_lengths = sorted(sentence_lengths)
-    median_length = (
-        sorted_lengths[len(sorted_lengths) // 2]
-        if len(sorted_lengths) % 2 != 0
-        else (
-            sorted_lengths[len(sorted_lengths) // 2 - 1]
-            + sorted_lengths[len(sorted_lengths) // 2]
-        )
-        / 2
-    )
+    median_length = statistics.median(sentence_lengths)
     return {
         "min": float(min_length),
         "max": float(max_length),
@@ -212,37 +274,76 @@ def count_words(
     Returns:
         Dictionary with words as keys and their counts as values
     """
-    # Remove code blocks
-    text = re.sub(r"```.*?```", "", text, flags=re.DOTALL)
-    # Remove newlines and backticks
-    text = text.replace("\n", "").replace("`", "")
+    return count_words_batch(
+        [text],
+        exclude_stopwords=exclude_stopwords,
+        exclude_punctuation=exclude_punctuation,
+        exclude_digits=exclude_digits,
+        min_word_length=min_word_length,
+        language_model=language_model,
+    )[0]
+
+
+def count_words_batch(
+    texts: List[str],
+    exclude_stopwords: bool = True,
+    exclude_punctuation: bool = True,
+    exclude_digits: bool = False,
+    min_word_length: int = 1,
+    language_model: str = "en_core_web_sm",
+    batch_size: int = 64,
+    n_process: int = 1,
+) -> List[Dict[str, int]]:
+    """
+    Count words in several texts at once, streaming them through nlp.pipe.
 
-    # Load spaCy model
-    nlp = spacy.load(language_model)
+    Args:
+        texts: The input texts to analyze
+        exclude_stopwords: Whether to exclude common stopwords
+        exclude_punctuation: Whether to exclude punctuation
+        exclude_digits: Whether to exclude words containing digits
+        min_word_length: Minimum word length to include in counts
+        language_model: spaCy language model to use
+        batch_size: Number of texts spaCy processes per batch
+        n_process: Number of worker processes spaCy uses
 
-    # Process the text
-    doc = nlp(text)
+    Returns:
+        A list of word count dictionaries, one per input text
+    """
+    cleaned_texts = []
+    for text in texts:
+        # Remove code blocks
+        text = remove_code_blocks(text)
+        # Remove newlines and backticks
+        cleaned_texts.append(text.replace("\n", "").replace("`", ""))
 
-    # Filter words based on parameters
-    filtered_words = []
-    for token in doc:
-        # Convert to lowercase
-        word = token.text.lower()
+    # Load spaCy model
+    nlp = _get_nlp(language_model, _LEXICAL_EXCLUDE)
+
+    results = []
+    for doc in nlp.pipe(cleaned_texts, batch_size=batch_size, n_process=n_process):
+        # Filter words based on parameters
+        filtered_words = []
+        for token in doc:
+            # Convert to lowercase
+            word = token.text.lower()
+
+            # Apply filters
+            if exclude_stopwords and token.is_stop:
+                continue
+            if exclude_punctuation and token.is_punct:
+                continue
+            if exclude_digits and token.like_num:
+                continue
+            if len(word) < min_word_length:
+                continue
 
-        # Apply filters
-        if exclude_stopwords and token.is_stop:
-            continue
-        if exclude_punctuation and token.is_punct:
-            continue
-        if exclude_digits and token.like_num:
-            continue
-        if len(word) < min_word_length:
-            continue
+            filtered_words.append(word)
 
-        filtered_words.append(word)
+        # Count word frequencies
+        results.append(dict(Counter(filtered_words).most_common(20)))
 
-    # Count word frequencies
-    return dict(Counter(filtered_words).most_common(20))
+    return results
 
 
 def count_adjectives(
@@ -271,7 +372,7 @@ def count_adjectives(
     text = remove_inline_code(text)
 
     # Load spaCy model
-    nlp = spacy.load(language_model)
+    nlp = _get_nlp(language_model, _POS_EXCLUDE)
 
     # Process the text
     doc = nlp(text)
@@ -301,6 +402,23 @@ def count_adjectives(
     return dict(Counter(filtered_adjectives).most_common(20))
 
 
+def _expand_braces(pattern: str) -> List[str]:
+    """Expand shell-style braces, e.g. "*.{md,mdx}" -> ["*.md", "*.mdx"]."""
+    match = _BRACES_RE.search(pattern)
+    if not match:
+        return [pattern]
+    prefix, suffix = pattern[: match.start()], pattern[match.end() :]
+    expanded: List[str] = []
+    for option in match.group(1).split(","):
+        expanded.extend(_expand_braces(prefix + option + suffix))
+    return expanded
+
+
+def _compile_globs(patterns: List[str]) -> re.Pattern:
+    """Combine glob patterns into a single regex over relative POSIX paths."""
+    return re.compile("|".join(translate(pattern) for pattern in patterns))
+
+
 def find_markdown_files(
     directory_path: Path,
     include_pattern: str = "*.{md,mdx}",
@@ -326,19 +444,52 @@ def find_markdown_files(
             f"Directory does not exist or is not a directory: {directory_path}"
         )
 
-    # Find all files matching the include pattern
-    all_files = list(directory_path.glob(f"**/{include_pattern}"))
+    # Compile the include/exclude globs into one regex each, once per call
+    include_re = _compile_globs(_expand_braces(include_pattern))
+    exclude_re = _compile_globs(exclude_patterns) if exclude_patterns else None
+
+    # Walk the tree once with scandir, matching paths relative to the
+    # directory as we go, like directory_path.glob("**/<pattern>")
+    matched_files: List[Path] = []
+    root = str(directory_path)
+    pending_dirs = [(root, "")]
+    while pending_dirs:
+        current_dir, prefix = pending_dirs.pop()
+        with os.scandir(current_dir) as entries:
+            for entry in entries:
+                relative_path = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    pending_dirs.append((entry.path, relative_path + "/"))
+                    continue
+                if not entry.is_file():
+                    continue
+                if not include_re.match(relative_path):
+                    continue
+                if exclude_re and exclude_re.match(relative_path):
+                    continue
+                matched_files.append(Path(entry.path))
+
+    return matched_files
+
 
-    # Apply exclude patterns
-    if exclude_patterns:
-        excluded_files: Set[Path] = set()
-        for pattern in exclude_patterns:
-            excluded_files.update(directory_path.glob(f"**/{pattern}"))
+def _process_file(
+    file_path: Path, processor_func: Callable[[Path], str], dry_run: bool
+) -> Tuple[bool, str]:
+    """Process a single file, returning whether it succeeded and its content."""
+    try:
+        # Process the file
+        processed_content = processor_func(file_path)
 
-        # Filter out excluded files
-        return [f for f in all_files if f not in excluded_files]
+        # Write the processed content back to the file if not in dry run mode
+        if not dry_run and processed_content:
+            file_path.write_text(processed_content)
+        return True, processed_content
+    except Exception as e:
+        # Log the error and continue with the next file
+        from loguru import logger
 
-    return all_files
+        logger.error(f"Error processing file {file_path}: {e}")
+        return False, ""
 
 
 def process_files_in_directory(
@@ -347,6 +498,7 @@ def process_files_in_directory(
     include_pattern: str = "*.{md,mdx}",
     exclude_patterns: List[str] | None = None,
     dry_run: bool = False,
+    max_workers: int | None = 1,
 ) -> Dict[Path, str]:
     """
     Process all matching files in a directory using the provided processor function.
@@ -357,31 +509,28 @@ def process_files_in_directory(
         include_pattern: Glob pattern for files to include (default is "*.md").
         exclude_patterns: List of glob patterns for files to exclude.
         dry_run: If True, files won't be modified, only return the processed content.
+        max_workers: Number of worker processes. 1 processes files in the current
+            process; None uses one worker per CPU. With more than one worker,
+            processor_func must be picklable (a module-level function).
 
     Returns:
         A dictionary mapping file paths to their processed content.
     """
     files = find_markdown_files(directory_path, include_pattern, exclude_patterns)
+    process = partial(_process_file, processor_func=processor_func, dry_run=dry_run)
 
     # Process each file
-    results = {}
-    for file_path in files:
-        try:
-            # Process the file
-            processed_content = processor_func(file_path)
-            results[file_path] = processed_content
-
-            # Write the processed content back to the file if not in dry run mode
-            if not dry_run and processed_content:
-                with open(file_path, "w") as f:
-                    f.write(processed_content)
-        except Exception as e:
-            # Log the error and continue with the next file
-            from loguru import logger
-
-            logger.error(f"Error processing file {file_path}: {e}")
+    if max_workers == 1 or len(files) <= 1:
+        outcomes = list(map(process, files))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            outcomes = list(executor.map(process, files, chunksize=8))
 
-    return results
+    return {
+        file_path: processed_content
+        for file_path, (succeeded, processed_content) in zip(files, outcomes)
+        if succeeded
+    }
 
 
 def guess_image_folder(file_path: Path) -> Path:
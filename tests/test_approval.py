@@ -1,12 +1,19 @@
+import shutil
+import threading
 import unittest
 from unittest.mock import patch
 import tempfile
 from pathlib import Path
 
 from hyperlint.approval import (
+    BatchEditorApprovalLog,
+    _ApprovalWriter,
     ConsoleEditorApprovalLog,
     ImageApprovalLog,
     SilentApprovalLog,
+    _decision_caches,
+    _parse_selection,
+    flush_approval_logs,
     get_approval_log
 )
 from hyperlint.config import SimpleConfig
@@ -23,6 +30,8 @@ class TestApprovalLog(unittest.TestCase):
         )
 
     def tearDown(self):
+        # Write pending log lines before their directory disappears
+        flush_approval_logs()
         # Clean up temporary directory
         self.temp_dir.cleanup()
 
@@ -45,11 +54,43 @@ class TestApprovalLog(unittest.TestCase):
         approval_log = get_approval_log(self.config)
         self.assertIsInstance(approval_log, ImageApprovalLog)
         
+        # Test batch
+        approval_log = get_approval_log(self.config, approval_type="batch")
+        self.assertIsInstance(approval_log, BatchEditorApprovalLog)
+
+        # Test editor types keep prompting unless batch is configured
+        approval_log = get_approval_log(self.config, approval_type="editor")
+        self.assertIsInstance(approval_log, ConsoleEditorApprovalLog)
+        self.config.approval_type = "batch"
+        approval_log = get_approval_log(self.config, approval_type="editor")
+        self.assertIsInstance(approval_log, BatchEditorApprovalLog)
+        self.config.approval_type = "image"
+
         # Test dry run override
         self.config.dry_run = True
         approval_log = get_approval_log(self.config, approval_type="console")
         self.assertIsInstance(approval_log, SilentApprovalLog)
 
+    @patch('rich.console.Console.input')
+    def test_silent_config_keeps_editor_prompts(self, mock_input):
+        """Test that approval_type "silent" does not auto-approve editor edits"""
+        mock_input.return_value = "n"
+        self.config.approval_type = "silent"
+        approval_log = get_approval_log(self.config, approval_type="editor")
+        issue = ReplaceLineFixableIssue(
+            line=10,
+            issue_message=["Test issue"],
+            existing_content="Test content"
+        )
+
+        result = approval_log.prompt_for_approval(
+            {'issue': issue, 'proposed_fix': "Fixed content", 'file_path': "test.py"}
+        )
+
+        self.assertIsInstance(approval_log, ConsoleEditorApprovalLog)
+        self.assertFalse(result)
+        mock_input.assert_called_once()
+
     @patch('rich.console.Console.input')
     def test_console_approval_prompt(self, mock_input):
         """Test that console approval correctly handles user input"""
@@ -82,6 +123,67 @@ class TestApprovalLog(unittest.TestCase):
         self.assertFalse(result)
         mock_input.assert_called_once()
 
+    @patch('rich.console.Console.input')
+    def test_console_approval_cache(self, mock_input):
+        """Test that identical edits reuse the first decision when caching is on"""
+        mock_input.return_value = "y"
+        self.config.cache_approvals = True
+        issue = ReplaceLineFixableIssue(
+            line=10,
+            issue_message=["Test issue"],
+            existing_content="Test content"
+        )
+        context = {
+            'issue': issue,
+            'proposed_fix': "Fixed content",
+            'file_path': "test.py"
+        }
+
+        approval_log = ConsoleEditorApprovalLog(self.config)
+        self.assertTrue(approval_log.prompt_for_approval(context))
+        self.assertTrue(approval_log.prompt_for_approval(context))
+        mock_input.assert_called_once()
+
+        # A fresh process loads the decision back from the log file
+        approval_log.flush()
+        _decision_caches.clear()
+        mock_input.reset_mock()
+        self.assertTrue(ConsoleEditorApprovalLog(self.config).prompt_for_approval(context))
+        mock_input.assert_not_called()
+
+    @patch('rich.console.Console.input')
+    def test_batch_approval_prompt(self, mock_input):
+        """Test that batch approval reads one selection for several edits"""
+        mock_input.return_value = "1,3-4"
+        self.config.approval_batch_size = 4
+        contexts = [
+            {
+                'issue': ReplaceLineFixableIssue(
+                    line=line,
+                    issue_message=["Test issue"],
+                    existing_content=f"Line {line}"
+                ),
+                'proposed_fix': f"Fixed line {line}",
+                'file_path': "test.py"
+            }
+            for line in range(1, 6)
+        ]
+
+        approval_log = BatchEditorApprovalLog(self.config)
+        result = approval_log.prompt_for_approvals(contexts)
+
+        # Five edits in batches of four take two prompts
+        self.assertEqual(mock_input.call_count, 2)
+        self.assertEqual(result, [True, False, True, True, True])
+
+    def test_parse_selection(self):
+        """Test batch selections are parsed into 1-based numbers"""
+        self.assertEqual(_parse_selection("1-3,5", 5), {1, 2, 3, 5})
+        self.assertEqual(_parse_selection(" 2, 4 ", 5), {2, 4})
+        self.assertEqual(_parse_selection("a", 3), {1, 2, 3})
+        self.assertEqual(_parse_selection("", 3), set())
+        self.assertEqual(_parse_selection("0-9,x", 3), {1, 2, 3})
+
     def test_silent_approval(self):
         """Test that silent approval always returns True"""
         approval_log = SilentApprovalLog(self.config)
@@ -99,6 +201,22 @@ class TestApprovalLog(unittest.TestCase):
         result = approval_log.prompt_for_approval(context)
         self.assertTrue(result)
 
+    def test_silent_approval_logging_disabled(self):
+        """Test that silent approvals are not logged when disabled in config"""
+        self.config.log_silent_approvals = False
+        approval_log = SilentApprovalLog(self.config)
+        issue = DeleteLineIssue(
+            line=15,
+            issue_message=["Delete this line"],
+            existing_content="Content to delete"
+        )
+
+        result = approval_log.prompt_for_approval({'issue': issue, 'file_path': "test.py"})
+        approval_log.flush()
+
+        self.assertTrue(result)
+        self.assertFalse(approval_log.get_log_file_path().exists())
+
     def test_log_decision(self):
         """Test that decisions are correctly logged"""
         approval_log = SilentApprovalLog(self.config)
@@ -114,6 +232,7 @@ class TestApprovalLog(unittest.TestCase):
         
         # Log a decision
         approval_log.log_decision("insertion", context, True)
+        approval_log.flush()
         
         # Check that log file was created
         log_path = approval_log.get_log_file_path()
@@ -128,5 +247,76 @@ class TestApprovalLog(unittest.TestCase):
             self.assertIn("true", log_content.lower())  # JSON boolean
 
 
+    def test_log_decision_batches_writes(self):
+        """Test that decisions are buffered until the batch size is reached"""
+        self.config.log_flush_batch = 2
+        approval_log = SilentApprovalLog(self.config)
+        log_path = approval_log.get_log_file_path()
+        context = {'file_path': "test.py"}
+
+        approval_log.log_decision("insertion", context, True)
+        self.assertFalse(log_path.exists())
+
+        approval_log.log_decision("deletion", context, False)
+        approval_log.flush()
+        with open(log_path, 'r') as f:
+            self.assertEqual(len(f.readlines()), 2)
+
+    @patch('rich.console.Console.input')
+    def test_console_decision_written_without_flush(self, mock_input):
+        """Test that a reviewed decision does not wait for a full batch"""
+        mock_input.return_value = "y"
+        approval_log = ConsoleEditorApprovalLog(self.config)
+        issue = ReplaceLineFixableIssue(
+            line=10,
+            issue_message=["Test issue"],
+            existing_content="Test content"
+        )
+
+        approval_log.prompt_for_approval(
+            {'issue': issue, 'proposed_fix': "Fixed content", 'file_path': "test.py"}
+        )
+        _ApprovalWriter.wait()
+
+        with open(approval_log.get_log_file_path(), 'r') as f:
+            self.assertEqual(len(f.readlines()), 1)
+
+    def test_log_recreated_after_directory_removed(self):
+        """Test that writes still land after the log directory is deleted"""
+        self.config.log_flush_batch = 1
+        approval_log = SilentApprovalLog(self.config)
+        log_path = approval_log.get_log_file_path()
+        context = {'file_path': "test.py"}
+
+        approval_log.log_decision("insertion", context, True)
+        approval_log.flush()
+        shutil.rmtree(log_path.parent)
+
+        approval_log.log_decision("deletion", context, False)
+        approval_log.flush()
+        with open(log_path, 'r') as f:
+            self.assertEqual(len(f.readlines()), 1)
+
+    def test_log_decision_from_threads(self):
+        """Test that decisions logged from several threads are all written"""
+        self.config.log_flush_batch = 7
+        approval_log = SilentApprovalLog(self.config)
+        context = {'file_path': "test.py"}
+
+        def log_many():
+            for _ in range(50):
+                approval_log.log_decision("insertion", context, True)
+
+        threads = [threading.Thread(target=log_many) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        approval_log.flush()
+
+        with open(approval_log.get_log_file_path(), 'r') as f:
+            self.assertEqual(len(f.readlines()), 200)
+
+
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -1,9 +1,12 @@
+import difflib
+
 import pytest
 from hyperlint.editors.core import (
     BaseEditor,
     DeleteLineIssue,
     InsertLineIssue,
     ReplaceLineFixableIssue,
+    diff,
 )
 
 
@@ -37,6 +40,19 @@ class TestBaseEditor:
 
         assert lookup == {1: "# Test Document", 2: "", 3: "This is a test."}
 
+    def test_line_views_cached_per_text(self, temp_markdown_file):
+        """Test line views are reused until the text changes."""
+        editor = MockEditor(path=temp_markdown_file)
+
+        lookup = editor.get_line_number_lookup()
+        numbered = editor.get_text_with_line_numbers()
+        assert editor.get_line_number_lookup() is lookup
+        assert editor.get_text_with_line_numbers() is numbered
+
+        editor.text = "# Changed"
+        assert editor.get_line_number_lookup() == {1: "# Changed"}
+        assert editor.get_text_with_line_numbers() == "1: # Changed"
+
     def test_get_text_with_line_numbers(self, temp_markdown_file):
         """Test that get_text_with_line_numbers correctly formats text with line numbers."""
         editor = MockEditor(path=temp_markdown_file)
@@ -232,3 +248,74 @@ class TestBaseEditor:
         # Make sure other content is preserved
         assert "This is a test document with **bold** text." in result
         assert "- Item 1" in result
+
+    def test_get_surrounding_lines(self, temp_markdown_file):
+        """Test surrounding lines are numbered and clipped to the document."""
+        editor = MockEditor(path=temp_markdown_file)
+        lines = ["one", "two", "three", "four", "five"]
+
+        assert editor._get_surrounding_lines(1, 1, lines) == ["1: one", "2: two"]
+        assert editor._get_surrounding_lines(3, 1, lines) == [
+            "2: two",
+            "3: three",
+            "4: four",
+        ]
+        assert editor._get_surrounding_lines(5, 10, lines)[-1] == "5: five"
+
+    def test_fix_all_keeps_order(self, temp_markdown_file, monkeypatch):
+        """Test concurrent fixes come back in the order they were requested."""
+        monkeypatch.setattr(
+            ReplaceLineFixableIssue,
+            "fix",
+            lambda self, context=None: f"{self.existing_content} [{context}]",
+        )
+        editor = MockEditor(path=temp_markdown_file)
+        editor.config.fix_workers = 4
+        tasks = [
+            (
+                ReplaceLineFixableIssue(
+                    line=line, issue_message=["issue"], existing_content=f"line {line}"
+                ),
+                f"context {line}",
+            )
+            for line in range(1, 11)
+        ]
+
+        fixes = editor._fix_all(tasks)
+
+        assert fixes == [f"line {line} [context {line}]" for line in range(1, 11)]
+
+
+    def test_generate_v2_insertions_and_deletions(self, tmp_path):
+        """Test insertions land before their line and past the end."""
+        path = tmp_path / "doc.md"
+        path.write_text("one\ntwo\nthree")
+        editor = MockEditor(path=path)
+        editor.config.approval_mode = False
+        editor.add_insertion(InsertLineIssue(line=2, insert_content="before two"))
+        editor.add_insertion(InsertLineIssue(line=9, insert_content="at the end"))
+        editor.add_insertion(InsertLineIssue(line=1, insert_content="first"))
+        editor.add_deletion(
+            DeleteLineIssue(line=3, issue_message=["remove"], existing_content="three")
+        )
+
+        result = editor.generate_v2()
+
+        assert result == "first\none\nbefore two\ntwo\nat the end"
+
+@pytest.mark.parametrize(
+    "changed_lines", [[], [0], [5, 7], [2, 15, 19], list(range(20))]
+)
+def test_diff_matches_difflib_for_replacements(changed_lines):
+    """Test the line-by-line diff matches difflib when only lines change."""
+    old_lines = [f"line {index}" for index in range(20)]
+    new_lines = [
+        f"changed {index}" if index in changed_lines else line
+        for index, line in enumerate(old_lines)
+    ]
+    old, new = "\n".join(old_lines), "\n".join(new_lines)
+
+    assert diff(old, new) == "\n".join(difflib.unified_diff(old_lines, new_lines))
+    assert diff(old, new, "a.md", "a.md") == "\n".join(
+        difflib.unified_diff(old_lines, new_lines, "a.md", "a.md")
+    )
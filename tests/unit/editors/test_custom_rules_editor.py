@@ -134,6 +134,29 @@ class TestCustomRuleEditor:
 
         assert len(filtered) == 0
 
+    def test_filtered_rules_cached_until_refresh(
+        self, rules_directory, sample_markdown_file
+    ):
+        """Test _filtered_rules is computed once and recomputed after refresh."""
+        editor = RulesEditor(
+            path=sample_markdown_file,
+            rules_directory=rules_directory,
+            exclude_rules=["passive_voice"],
+        )
+
+        with mock.patch.object(
+            RulesEditor, "_load_rules", wraps=editor._load_rules
+        ) as mock_load:
+            first = editor._filtered_rules
+            second = editor._filtered_rules
+            assert first is second
+            assert mock_load.call_count == 1
+
+            editor.config.custom_rules.exclude_rules = []
+            editor.refresh()
+            assert len(editor._filtered_rules) == 3
+            assert mock_load.call_count == 2
+
     @mock.patch("hyperlint.editors.custom_rules.get_issues")
     def test_apply_rule(self, mock_get_issues, rules_directory, sample_markdown_file):
         """Test apply_rule with a basic rule."""
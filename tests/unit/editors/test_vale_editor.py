@@ -0,0 +1,93 @@
+import json
+import os
+import subprocess
+from unittest import mock
+
+from hyperlint.config import SimpleConfig
+from hyperlint.editors.vale import ValeEditor, run_vale
+
+
+class TestValeRunBatch:
+    """Tests for ValeEditor.run_batch."""
+
+    @mock.patch("hyperlint.editors.vale._vale_path", return_value="vale")
+    @mock.patch("hyperlint.editors.vale.subprocess.run")
+    def test_run_batch_single_process(self, mock_run, _mock_vale_path, tmp_path):
+        """Test every file is linted in place by one Vale process."""
+        first = tmp_path / "first.md"
+        second = tmp_path / "second.mdx"
+        first.write_text("# First")
+        second.write_text("# Second")
+        alert = {"Check": "Vale.Spelling", "Message": "Did you mean?", "Line": 1}
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=1, stdout=json.dumps({str(first): [alert]})
+        )
+
+        results = ValeEditor.run_batch([first, second], SimpleConfig())
+
+        mock_run.assert_called_once()
+        command = mock_run.call_args.args[0]
+        assert command[-2:] == [os.path.abspath(first), os.path.abspath(second)]
+        assert [issue.line for issue in results[first]] == [1]
+        assert results[second] == []
+
+    @mock.patch("hyperlint.editors.vale._MAX_ARGV_BYTES", 1)
+    @mock.patch("hyperlint.editors.vale._vale_path", return_value="vale")
+    @mock.patch("hyperlint.editors.vale.subprocess.run")
+    def test_run_batch_chunks_and_skips_failed_chunks(
+        self, mock_run, _mock_vale_path, tmp_path
+    ):
+        """Test paths are split across processes and failed ones left out."""
+        paths = [tmp_path / name for name in ["a.md", "b.md", "c.md"]]
+        for path in paths:
+            path.write_text("# Doc")
+        alert = {"Check": "Vale.Spelling", "Message": "Did you mean?", "Line": 1}
+
+        def fake_run(command, **kwargs):
+            if command[-1].endswith("b.md"):
+                raise OSError(7, "Argument list too long")
+            return subprocess.CompletedProcess(
+                args=command, returncode=1, stdout=json.dumps({command[-1]: [alert]})
+            )
+
+        mock_run.side_effect = fake_run
+
+        results = ValeEditor.run_batch(paths, SimpleConfig())
+
+        assert mock_run.call_count == 3
+        assert set(results) == {paths[0], paths[2]}
+        assert [issue.line for issue in results[paths[2]]] == [1]
+
+
+class TestRunVale:
+    """Tests for run_vale."""
+
+    @mock.patch("hyperlint.editors.vale._vale_path", return_value="vale")
+    @mock.patch("hyperlint.editors.vale.subprocess.run")
+    def test_run_vale_lints_temporary_file(
+        self, mock_run, _mock_vale_path, tmp_path, monkeypatch
+    ):
+        """Test the text is linted from a temporary file that is removed."""
+        monkeypatch.setenv("PROJECT_ROOT", str(tmp_path))
+        alert = {"Check": "Vale.Spelling", "Message": "Did you mean?", "Line": 2}
+
+        def fake_run(command, **kwargs):
+            temp_file = command[-1]
+            assert temp_file.endswith(".mdx")
+            with open(temp_file) as f:
+                assert f.read() == "# Title\nteh text"
+            return subprocess.CompletedProcess(
+                args=command, returncode=1, stdout=json.dumps({temp_file: [alert]})
+            )
+
+        mock_run.side_effect = fake_run
+
+        issues = run_vale("# Title\nteh text", "vale.ini", is_mdx=True)
+
+        assert [issue.line for issue in issues] == [2]
+        assert list(tmp_path.iterdir()) == []
+
+    @mock.patch("hyperlint.editors.vale._vale_path", return_value=None)
+    def test_run_vale_without_vale(self, _mock_vale_path):
+        """Test no issues are reported when Vale is not installed."""
+        assert run_vale("# Title", "vale.ini") == []
@@ -0,0 +1,59 @@
+import os
+from unittest import mock
+
+import pytest
+
+
+@pytest.fixture
+def approver(monkeypatch):
+    """Import the approver module, which configures a model on import."""
+    pytest.importorskip("dspy")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    from hyperlint import approver
+
+    return approver
+
+
+@pytest.fixture
+def change_log(tmp_path):
+    log_file = tmp_path / "editor_judge.jsonl"
+    log_file.write_text('{"issue_type": "edit", "approved": true}\n\n')
+    return log_file
+
+
+class TestLoadChangeRecords:
+    """Tests for the approver's cached approval log parsing."""
+
+    def test_cache_reused_until_log_changes(self, approver, change_log, tmp_path):
+        """Test the cache is read back and refreshed when the log grows."""
+        cache_dir = tmp_path / "cache"
+
+        first = approver._load_change_records(change_log, cache_dir)
+        with mock.patch.object(
+            approver, "_read_change_records", wraps=approver._read_change_records
+        ) as read:
+            assert approver._load_change_records(change_log, cache_dir) == first
+            read.assert_not_called()
+
+        with change_log.open("a") as f:
+            f.write('{"issue_type": "delete", "approved": false}\n')
+        records = approver._load_change_records(change_log, cache_dir)
+
+        assert [record["issue_type"] for record in records] == ["edit", "delete"]
+
+    def test_one_cache_file_per_log(self, approver, change_log, tmp_path):
+        """Test a changed log overwrites its cache and old pickles are removed."""
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        (cache_dir / "old.pkl").write_bytes(b"stale")
+
+        approver._load_change_records(change_log, cache_dir)
+        for approved in ["true", "false"]:
+            with change_log.open("a") as f:
+                f.write(f'{{"issue_type": "edit", "approved": {approved}}}\n')
+            approver._load_change_records(change_log, cache_dir)
+
+        cache_files = os.listdir(cache_dir)
+        assert len(cache_files) == 1
+        assert cache_files[0].endswith(".json")
+
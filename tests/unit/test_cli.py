@@ -1,10 +1,19 @@
+import threading
+import time
 from pathlib import Path
 from unittest import mock
 
 import pytest
 from typer.testing import CliRunner
 
-from hyperlint.cli import app
+from hyperlint.cli import (
+    _console,
+    _make_progress,
+    _PlainProgress,
+    app,
+    collect_files,
+    iter_files,
+)
 
 
 @pytest.fixture
@@ -16,7 +25,7 @@ def runner():
 class TestCLI:
     """Tests for the CLI commands."""
 
-    @mock.patch("hyperlint.cli.ValeEditor")
+    @mock.patch("hyperlint.editors.vale.ValeEditor")
     def test_vale_single_file(self, mock_vale_editor, runner, tmp_path):
         """Test the vale command with a single file."""
         # Create a test file
@@ -50,7 +59,7 @@ class TestCLI:
         # Check that it fails appropriately
         assert result.exit_code == 0
 
-    @mock.patch("hyperlint.cli.ValeEditor")
+    @mock.patch("hyperlint.editors.vale.ValeEditor")
     def test_vale_dry_run(self, mock_vale_editor, runner, tmp_path):
         """Test the vale command with dry run option."""
         # Create a test file
@@ -70,8 +79,90 @@ class TestCLI:
         # Verify dry run was called
         mock_instance.dry_run.assert_called_once()
 
+    @mock.patch("hyperlint.editors.vale.ValeEditor")
+    def test_vale_multiple_files_with_jobs(self, mock_vale_editor, runner, tmp_path):
+        """Test each file's dry run diff is printed whole, after its file name."""
+        for name in ["a.md", "b.md", "c.md"]:
+            (tmp_path / name).write_text("# Test Document")
+        mock_vale_editor.run_batch.side_effect = lambda paths, _: {
+            p: [] for p in paths
+        }
+
+        def make_editor(path, config, **kwargs):
+            editor = mock.Mock()
+            editor.dry_run.return_value = f"--- {path}\n+++ {path}\n-old\n+new"
+            return editor
+
+        mock_vale_editor.side_effect = make_editor
+
+        result = runner.invoke(
+            app, ["apply", "vale", str(tmp_path), "--dry-run", "--jobs", "3"]
+        )
+
+        assert result.exit_code == 0
+        assert "Completed: 3 files processed successfully" in result.stdout
+        for name in ["a.md", "b.md", "c.md"]:
+            path = tmp_path / name
+            assert f"--- {path}\n+++ {path}\n-old\n+new\n" in result.stdout
+        mock_vale_editor.run_batch.assert_called_once()
+
+    @mock.patch("hyperlint.editors.vale.ValeEditor")
+    def test_vale_batch_failures_lint_per_file(
+        self, mock_vale_editor, runner, tmp_path
+    ):
+        """Test files missing from the batch result get no vale_issues."""
+        for name in ["a.md", "b.md"]:
+            (tmp_path / name).write_text("# Test Document")
+        mock_vale_editor.run_batch.return_value = {tmp_path / "a.md": []}
+
+        result = runner.invoke(app, ["apply", "vale", str(tmp_path), "--dry-run"])
+
+        assert result.exit_code == 0
+        kwargs = {
+            call.kwargs["path"]: call.kwargs
+            for call in mock_vale_editor.call_args_list
+        }
+        assert kwargs[tmp_path / "a.md"]["vale_issues"] == []
+        assert "vale_issues" not in kwargs[tmp_path / "b.md"]
+
+    @mock.patch("hyperlint.editors.vale.ValeEditor")
+    def test_vale_jobs_without_dry_run_one_at_a_time(
+        self, mock_vale_editor, runner, tmp_path
+    ):
+        """Test files are updated one at a time, since each update prompts."""
+        for name in ["a.md", "b.md", "c.md"]:
+            (tmp_path / name).write_text("# Test Document")
+        mock_vale_editor.run_batch.side_effect = lambda paths, _: {
+            p: [] for p in paths
+        }
+        lock = threading.Lock()
+        running = []
+        overlaps = []
+
+        def update_file():
+            with lock:
+                running.append(True)
+                overlaps.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.pop()
+
+        mock_vale_editor.return_value.update_file.side_effect = update_file
+
+        result = runner.invoke(
+            app,
+            ["apply", "vale", str(tmp_path), "--no-require-approval", "--jobs", "3"],
+        )
+
+        assert result.exit_code == 0
+        assert "--jobs only applies to dry runs" in result.stdout
+        assert "Completed: 3 files processed successfully" in result.stdout
+        assert overlaps == [1, 1, 1]
+        config = mock_vale_editor.call_args.kwargs["config"]
+        assert config.approval_mode is False
+
     @pytest.mark.skip(reason="Mock assertion mismatch - fix in next iteration")
-    @mock.patch("hyperlint.cli.RulesEditor")
+    @mock.patch("hyperlint.editors.custom_rules.RulesEditor")
     def test_custom_rules_single_file(self, mock_rules_editor, runner, tmp_path):
         """Test the custom-rules command with a single file."""
         # Create a test file and rules directory
@@ -112,6 +203,35 @@ class TestCLI:
         )
         mock_instance.update_file.assert_called_once()
 
+    @mock.patch("hyperlint.editors.custom_rules.RulesEditor")
+    def test_rules_exclude_csv(self, mock_rules_editor, runner, tmp_path):
+        """Test comma-separated --exclude-rules values reach the editor split."""
+        test_file = tmp_path / "test.md"
+        test_file.write_text("# Test Document")
+        rules_dir = tmp_path / "rules"
+        rules_dir.mkdir()
+
+        result = runner.invoke(
+            app,
+            [
+                "apply",
+                "rules",
+                str(test_file),
+                "--rules-directory",
+                str(rules_dir),
+                "--exclude-rules",
+                "passive_voice, word_choice",
+                "--exclude-rules",
+                "transitions",
+            ],
+        )
+
+        assert result.exit_code == 0
+        expected = ["passive_voice", "word_choice", "transitions"]
+        kwargs = mock_rules_editor.call_args.kwargs
+        assert kwargs["exclude_rules"] == expected
+        assert kwargs["config"].custom_rules.exclude_rules == expected
+
     def test_list_rules(self, runner, tmp_path):
         """Test the list-rules command."""
         # Create a test rules directory with some rule files
@@ -131,6 +251,15 @@ class TestCLI:
         assert "- rule2" in result.stdout
         assert "- rule3" in result.stdout
 
+    def test_list_rules_missing_directory(self, runner, tmp_path):
+        """Test the list-rules command rejects a missing directory."""
+        result = runner.invoke(
+            app, ["manage-rules", "list", str(tmp_path / "missing")]
+        )
+
+        # Typer reports the invalid argument as a usage error
+        assert result.exit_code == 2
+
     def test_view_rule(self, runner, tmp_path):
         """Test the view-rule command."""
         # Create a test rules directory with a rule file
@@ -167,3 +296,99 @@ class TestCLI:
         new_rule_path = rules_dir / "new_rule.md"
         assert new_rule_path.exists()
         assert "Rule: new_rule" in new_rule_path.read_text()
+
+    def test_create_rule_existing(self, runner, tmp_path):
+        """Test the create-rule command refuses to overwrite a rule."""
+        rules_dir = tmp_path / "rules"
+        rules_dir.mkdir()
+        (rules_dir / "existing.md").write_text("# Keep me")
+
+        result = runner.invoke(
+            app, ["manage-rules", "create", str(rules_dir), "existing"]
+        )
+
+        assert result.exit_code == 1
+        assert "Rule already exists" in result.stdout
+        assert (rules_dir / "existing.md").read_text() == "# Keep me"
+
+
+class TestCollectFiles:
+    """Tests for collect_files."""
+
+    @pytest.fixture
+    def docs_tree(self, tmp_path):
+        (tmp_path / "nested").mkdir()
+        (tmp_path / "dir.md").mkdir()
+        for name in ["a.md", "b.mdx", "notes.txt", "nested/c.md", "nested/d.mdx"]:
+            (tmp_path / name).write_text("# Doc")
+        return tmp_path
+
+    def test_non_recursive(self, docs_tree):
+        files = collect_files(str(docs_tree))
+        assert files == [docs_tree / "a.md", docs_tree / "b.mdx"]
+
+    def test_recursive(self, docs_tree):
+        files = collect_files(str(docs_tree), recursive=True)
+        assert files == [
+            docs_tree / "a.md",
+            docs_tree / "b.mdx",
+            docs_tree / "nested" / "c.md",
+            docs_tree / "nested" / "d.mdx",
+        ]
+
+    def test_include_and_exclude_patterns(self, docs_tree):
+        files = collect_files(
+            str(docs_tree),
+            recursive=True,
+            include_patterns=["*.md", "nested/*.mdx"],
+            exclude_patterns=["nested/c.md"],
+        )
+        assert files == [docs_tree / "a.md", docs_tree / "nested" / "d.mdx"]
+
+    def test_wildcards_stay_within_one_segment(self, tmp_path):
+        keep = tmp_path / "docs" / "draft_old" / "keep.md"
+        draft = tmp_path / "docs" / "draft_new.md"
+        wip = tmp_path / "docs" / "drafts" / "wip.md"
+        deep = tmp_path / "docs" / "drafts" / "sub" / "deep.md"
+        for path in [keep, draft, wip, deep]:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("# Doc")
+
+        excluded = collect_files(
+            str(tmp_path), recursive=True, exclude_patterns=["draft_*.md"]
+        )
+        included = collect_files(
+            str(tmp_path), recursive=True, include_patterns=["drafts/*.md"]
+        )
+
+        assert excluded == [keep, deep, wip]
+        assert included == [wip]
+
+    def test_missing_literal_path_skips_glob(self, docs_tree):
+        with mock.patch("hyperlint.cli.glob.iglob") as mock_glob:
+            assert collect_files(str(docs_tree / "missing.md")) == []
+        mock_glob.assert_not_called()
+
+    def test_glob_pattern(self, docs_tree):
+        files = collect_files(str(docs_tree / "**" / "*.mdx"), recursive=True)
+        assert files == [docs_tree / "b.mdx", docs_tree / "nested" / "d.mdx"]
+
+    def test_iter_files_yields_lazily(self, docs_tree):
+        files = iter_files(str(docs_tree), recursive=True)
+        assert next(files).suffix in {".md", ".mdx"}
+        assert len(list(files)) == 3
+
+
+def test_make_progress_without_terminal():
+    """Test a plain counter replaces the progress bar when not on a terminal."""
+    with mock.patch.object(
+        type(_console()), "is_terminal", new_callable=mock.PropertyMock
+    ) as mock_is_terminal:
+        mock_is_terminal.return_value = False
+        with _make_progress() as progress:
+            task = progress.add_task("Processing files...", total=2)
+            progress.advance(task)
+            progress.advance(task)
+
+    assert isinstance(progress, _PlainProgress)
+    assert progress.completed == 2
@@ -0,0 +1,159 @@
+import os
+from unittest import mock
+
+import pytest
+import yaml
+
+from hyperlint.config import (
+    SimpleConfig,
+    create_default_config,
+    find_config_file,
+    load_config,
+)
+
+
+class TestLoadConfig:
+    """Tests for load_config."""
+
+    def test_load_config_from_path(self, tmp_path):
+        """Test a config file is parsed and validated."""
+        config_path = tmp_path / "hyperlint.yaml"
+        config_path.write_text("dry_run: true\napproval_type: silent\n")
+
+        config = load_config(config_path)
+
+        assert config.dry_run is True
+        assert config.approval_type == "silent"
+
+    def test_load_config_parses_once(self, tmp_path):
+        """Test repeated loads reuse the parsed file but return copies."""
+        config_path = tmp_path / "hyperlint.yaml"
+        config_path.write_text("dry_run: true\n")
+
+        with mock.patch.object(
+            SimpleConfig, "from_yaml", wraps=SimpleConfig.from_yaml
+        ) as mock_from_yaml:
+            first = load_config(config_path)
+            first.dry_run = False
+            second = load_config(config_path)
+
+        assert mock_from_yaml.call_count == 1
+        assert second.dry_run is True
+        assert first is not second
+
+    def test_load_config_rereads_changed_file(self, tmp_path):
+        """Test an edited config file is parsed again."""
+        config_path = tmp_path / "hyperlint.yaml"
+        config_path.write_text("dry_run: true\n")
+        assert load_config(config_path).dry_run is True
+
+        config_path.write_text("dry_run: false\n")
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_config(config_path).dry_run is False
+
+
+def test_find_config_file_in_working_directory(tmp_path, monkeypatch):
+    """Test the working directory config is found and the lookup reused."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".hyperlint.yaml").write_text("dry_run: true\n")
+
+    with mock.patch("hyperlint.config.os.scandir", wraps=os.scandir) as scandir:
+        assert find_config_file() == tmp_path / ".hyperlint.yaml"
+        assert find_config_file() == tmp_path / ".hyperlint.yaml"
+
+    assert scandir.call_count == 1
+
+
+def test_find_config_file_sees_new_config(tmp_path, monkeypatch):
+    """Test a config created after a failed lookup is found next time."""
+    monkeypatch.chdir(tmp_path)
+    with mock.patch("hyperlint.config.os.path.expanduser", return_value=str(tmp_path)):
+        assert find_config_file() is None
+
+        # Written within the same mtime tick on coarse filesystems
+        stat = tmp_path.stat()
+        (tmp_path / "hyperlint.yaml").write_text("dry_run: true\n")
+        os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert find_config_file() == tmp_path / "hyperlint.yaml"
+
+
+def test_find_config_file_sees_new_home_config(tmp_path, monkeypatch):
+    """Test a home config created after a failed lookup is found next time."""
+    cwd = tmp_path / "project"
+    cwd.mkdir()
+    monkeypatch.chdir(cwd)
+    with mock.patch("hyperlint.config.os.path.expanduser", return_value=str(tmp_path)):
+        assert find_config_file() is None
+
+        home_config = tmp_path / ".config" / "hyperlint" / "config.yaml"
+        home_config.parent.mkdir(parents=True)
+        home_config.write_text("dry_run: true\n")
+
+        assert find_config_file() == home_config
+
+
+def test_default_paths_follow_working_directory(tmp_path, monkeypatch):
+    """Test default paths resolve against the directory in use at the time."""
+    monkeypatch.chdir(tmp_path)
+
+    config = SimpleConfig()
+
+    assert config.vale.config_path == tmp_path / ".vale.ini"
+    assert config.custom_rules.rules_directory == tmp_path / "rules"
+    assert config.hyperlint_dir == tmp_path / ".hyperlint"
+
+
+class TestCreateDefaultConfig:
+    """Tests for create_default_config."""
+
+    def test_default_config_matches_model(self, tmp_path, monkeypatch):
+        """Test the written default config loads back to the model defaults."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".vale.ini").write_text("")
+        (tmp_path / "rules").mkdir()
+        (tmp_path / ".hyperlint").mkdir()
+        config_path = tmp_path / "hyperlint.yaml"
+
+        create_default_config(config_path)
+        data = yaml.safe_load(config_path.read_text())
+        config = SimpleConfig.model_validate(data)
+
+        assert set(data) == set(SimpleConfig.model_fields)
+        defaults = SimpleConfig()
+        path_fields = {"vale", "custom_rules", "hyperlint_dir"}
+        assert config.model_dump(exclude=path_fields) == defaults.model_dump(
+            exclude=path_fields
+        )
+        assert config.vale.config_path.name == defaults.vale.config_path.name
+        assert config.hyperlint_dir.name == defaults.hyperlint_dir.name
+
+
+@pytest.mark.parametrize(
+    "name, file_name",
+    [
+        ("DEFAULT_CONFIG_PATH", "hyperlint-config.yaml"),
+        ("DEFAULT_INI_PATH", ".vale.ini"),
+        ("DEFAULT_CUSTOM_RULES_PATH", "rules"),
+        ("DEFAULT_HYPERLINT_STORAGE_DIR", ".hyperlint"),
+    ],
+)
+def test_deprecated_path_constants(name, file_name, tmp_path, monkeypatch):
+    """Test the old path constants still import, resolved when accessed."""
+    monkeypatch.chdir(tmp_path)
+    import hyperlint.config
+
+    with pytest.warns(DeprecationWarning, match=name):
+        assert getattr(hyperlint.config, name) == tmp_path / file_name
+
+
+def test_deprecated_config_path_from_cli(tmp_path, monkeypatch):
+    """Test DEFAULT_CONFIG_PATH can still be imported from the CLI module."""
+    monkeypatch.chdir(tmp_path)
+
+    with pytest.warns(DeprecationWarning):
+        from hyperlint.cli import DEFAULT_CONFIG_PATH
+
+    assert DEFAULT_CONFIG_PATH == tmp_path / "hyperlint-config.yaml"
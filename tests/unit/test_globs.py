@@ -0,0 +1,43 @@
+import fnmatch
+import re
+
+import pytest
+
+from hyperlint.globs import translate
+
+
+def matches(pattern, path):
+    return re.match(translate(pattern), path) is not None
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    ["[^a].md", "[!a].md", "[a-c].md", "[]a].md", "[!]a].md", "[\\].md", "[&~|].md"],
+)
+@pytest.mark.parametrize(
+    "name", ["a.md", "b.md", "^.md", "].md", "\\.md", "&.md", "~.md", "|.md"]
+)
+def test_classes_match_like_fnmatch(pattern, name):
+    assert matches(pattern, name) == fnmatch.fnmatchcase(name, pattern)
+
+
+@pytest.mark.parametrize("pattern", ["a[ -~]b", "a[!x]b", "a[.-0]b"])
+def test_classes_never_match_separator(pattern):
+    assert fnmatch.fnmatchcase("a/b", pattern)
+    assert not matches(pattern, "a/b")
+    assert matches(pattern, "a.b")
+
+
+@pytest.mark.parametrize(
+    "pattern, path, expected",
+    [
+        ("draft_*.md", "docs/draft_old/keep.md", False),
+        ("draft_*.md", "docs/draft_new.md", True),
+        ("drafts/*.md", "docs/drafts/sub/deep.md", False),
+        ("drafts/*.md", "docs/drafts/wip.md", True),
+        ("node_modules/**", "pkg/node_modules/a/README.md", True),
+        ("docs/**/*.md", "docs/a/b/c.md", True),
+    ],
+)
+def test_wildcards_and_directories(pattern, path, expected):
+    assert matches(pattern, path) == expected
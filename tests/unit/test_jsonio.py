@@ -0,0 +1,31 @@
+from pathlib import Path
+
+import pytest
+
+from hyperlint import jsonio
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    """Run each test with and without orjson."""
+    if request.param == "orjson" and jsonio.orjson is None:
+        pytest.skip("orjson is not installed")
+    if request.param == "json":
+        monkeypatch.setattr(jsonio, "orjson", None)
+    return request.param
+
+
+def test_dumps_is_compact(backend):
+    encoded = jsonio.dumps({"file_path": Path("docs/a.md"), "approved": True})
+
+    assert encoded == b'{"file_path":"docs/a.md","approved":true}'
+
+
+def test_dumps_keeps_unicode(backend):
+    assert jsonio.dumps({"text": "café"}) == '{"text":"café"}'.encode()
+
+
+def test_loads_round_trip(backend):
+    data = {"url": "https://example.com", "pages": [{"markdown": "# Café"}]}
+
+    assert jsonio.loads(jsonio.dumps(data)) == data
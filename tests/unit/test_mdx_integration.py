@@ -46,6 +46,20 @@ import { Button } from './Button'
         finally:
             mdx_path.unlink()
     
+    def test_mdx_parser_built_on_first_access(self, tmp_path):
+        """Test that the MDX file is not read until the parser is needed."""
+        mdx_path = tmp_path / "doc.mdx"
+        mdx_path.write_text("# Title\n<Button>Click</Button>\n")
+
+        editor = TestMDXEditor(path=mdx_path, config=SimpleConfig())
+        assert editor.is_mdx is True
+        assert editor.text is None
+
+        parser = editor.mdx_parser
+        assert parser is not None
+        assert editor.mdx_parser is parser
+        assert editor.text is not None
+
     def test_md_file_detection(self):
         """Test that regular MD files are not treated as MDX."""
         md_content = """# Title
@@ -0,0 +1,85 @@
+import re
+
+import pytest
+from hyperlint.utils import find_markdown_files, get_word_counts, remove_code_blocks
+
+
+class TestRemoveCodeBlocks:
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "no fences here",
+            "before\n```python\nprint('hi')\n```\nafter",
+            "```a``` middle ```b``` end",
+            "unterminated ``` fence",
+            "````four``` ticks",
+            "``````",
+            "",
+        ],
+    )
+    def test_matches_regex_behaviour(self, text):
+        """Test the fence scanner matches the original non-greedy regex."""
+        expected = re.sub(r"```.*?```", "", text, flags=re.DOTALL)
+        assert remove_code_blocks(text) == expected
+
+    def test_removes_fenced_block(self):
+        """Test a fenced block is removed and surrounding text is kept."""
+        text = "Intro\n```\ncode\n```\nOutro"
+        assert remove_code_blocks(text) == "Intro\n\nOutro"
+
+
+class TestGetWordCounts:
+    def test_counts_case_insensitively(self):
+        """Test words are lowercased and split on any whitespace."""
+        counts = get_word_counts("The cat\tsaw THE\ndog the end")
+
+        assert counts[0] == ("the", 3)
+        assert dict(counts) == {"the": 3, "cat": 1, "saw": 1, "dog": 1, "end": 1}
+
+
+class TestFindMarkdownFiles:
+    def test_finds_md_and_mdx_recursively(self, tmp_path):
+        """Test the default pattern matches .md and .mdx files in subdirectories."""
+        (tmp_path / "guide.md").write_text("# Guide")
+        (tmp_path / "notes.txt").write_text("not markdown")
+        nested = tmp_path / "docs"
+        nested.mkdir()
+        (nested / "page.mdx").write_text("# Page")
+
+        files = find_markdown_files(tmp_path)
+
+        assert sorted(files) == [nested / "page.mdx", tmp_path / "guide.md"]
+
+    def test_exclude_patterns(self, tmp_path):
+        """Test files matching an exclude pattern are skipped."""
+        (tmp_path / "guide.md").write_text("# Guide")
+        (tmp_path / "draft_guide.md").write_text("# Draft")
+
+        files = find_markdown_files(tmp_path, "*.md", ["draft_*.md"])
+
+        assert files == [tmp_path / "guide.md"]
+
+    def test_directory_qualified_patterns(self, tmp_path):
+        """Test patterns with directories match paths below the search root."""
+        (tmp_path / "guide.md").write_text("# Guide")
+        drafts = tmp_path / "docs" / "drafts"
+        drafts.mkdir(parents=True)
+        (drafts / "wip.md").write_text("# WIP")
+        (drafts / "sub").mkdir()
+        (drafts / "sub" / "deep.md").write_text("# Deep")
+        modules = tmp_path / "node_modules" / "pkg"
+        modules.mkdir(parents=True)
+        (modules / "README.md").write_text("# Package")
+
+        included = find_markdown_files(tmp_path, "drafts/*.md")
+        remaining = find_markdown_files(
+            tmp_path, "*.md", ["drafts/*.md", "node_modules/**"]
+        )
+
+        assert included == [drafts / "wip.md"]
+        assert sorted(remaining) == [drafts / "sub" / "deep.md", tmp_path / "guide.md"]
+
+    def test_missing_directory_raises(self, tmp_path):
+        """Test a missing directory raises ValueError."""
+        with pytest.raises(ValueError):
+            find_markdown_files(tmp_path / "missing")